@@ -0,0 +1,63 @@
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from issuetruck.archive import commit_archive, discard_archive, stage_archive
+from issuetruck.issue import split_issues_to_archive
+from issuetruck.markdown import dump_path, parse_path
+
+from .synthetic import write_todo
+
+SIZE = 300_000
+
+
+def archive_in_memory(filepath: Path, archive_filepath: Path) -> None:
+    to_archive, to_keep = split_issues_to_archive(parse_path(filepath, cache=False))
+    archived_issues = parse_path(archive_filepath, cache=False)
+    dump_path(archive_filepath, to_archive + archived_issues)
+    dump_path(filepath, to_keep)
+
+
+def archive_streaming(filepath: Path, archive_filepath: Path) -> None:
+    staged = stage_archive(filepath, archive_filepath)
+    try:
+        commit_archive(staged, filepath, archive_filepath)
+    finally:
+        discard_archive(staged)
+
+
+def measure(
+    archive: Callable[[Path, Path], None], source: Path, directory: Path
+) -> tuple[float, int]:
+    filepath = directory / "ToDo.md"
+    archive_filepath = directory / "ToDo-archive.md"
+    shutil.copyfile(source, filepath)
+    shutil.copyfile(source, archive_filepath)
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        archive(filepath, archive_filepath)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return time.perf_counter() - started, peak
+
+
+def main(size: int = SIZE) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        source = write_todo(Path(directory) / "Source.md", size)
+        print(f"{size} issues, archive file of the same size")
+        for name, archive in (
+            ("in memory", archive_in_memory),
+            ("streaming", archive_streaming),
+        ):
+            elapsed, peak = measure(archive, source, Path(directory))
+            print(f"{name:<10} | {elapsed:>7.2f}s | {peak / (1 << 20):>8.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:2]))
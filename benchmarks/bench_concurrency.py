@@ -0,0 +1,67 @@
+import multiprocessing
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from issuetruck.app import update_issue
+from issuetruck.issue import edit_issue
+from issuetruck.lock import RETRIES
+from issuetruck.markdown import parse_path
+
+from .synthetic import write_todo
+
+PROCESSES = 8
+OPERATIONS = 50
+ISSUES = 1_000
+
+
+def worker(filepath: Path, number: int, operations: int, optimistic: bool) -> None:
+    import os
+
+    from issuetruck.lock import OPTIMISTIC_ENV
+
+    if optimistic:
+        os.environ[OPTIMISTIC_ENV] = "1"
+    for operation in range(operations):
+        update_issue(
+            filepath,
+            1,
+            lambda issue: edit_issue(
+                issue, date.today(), comment=f"worker {number} operation {operation}"
+            ),
+        )
+
+
+def run_stress(
+    filepath: Path, processes: int, operations: int, optimistic: bool
+) -> tuple[int, float]:
+    started = time.perf_counter()
+    workers = [
+        multiprocessing.Process(
+            target=worker, args=(filepath, number, operations, optimistic)
+        )
+        for number in range(processes)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+    elapsed = time.perf_counter() - started
+    issue = next(issue for issue in parse_path(filepath, cache=False) if issue.id == 1)
+    return issue.content.count(" - edit - worker "), elapsed
+
+
+def main(processes: int = PROCESSES, operations: int = OPERATIONS) -> None:
+    print(f"{processes} processes x {operations} edits of one issue, {RETRIES} retries")
+    for name, optimistic in (("lock", False), ("optimistic", True)):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = write_todo(Path(directory) / "ToDo.md", ISSUES)
+            applied, elapsed = run_stress(filepath, processes, operations, optimistic)
+            assert applied == processes * operations, applied
+            print(f"{name:<10} | {elapsed:>7.2f}s | {applied / elapsed:>7.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:3]))
@@ -0,0 +1,47 @@
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, Iterable
+
+from issuetruck.dates import format_date, parse_date
+
+CELLS = 1_000_000
+DISTINCT = 1_500
+
+
+def parse_date_uncached(date_value: str) -> date | None:
+    parts = date_value.split("/")
+    if len(parts) != 3:
+        return None
+    return date(int(parts[2]), int(parts[1]), int(parts[0]))
+
+
+def format_date_uncached(value: date | None) -> str:
+    return f"{value.day:02}/{value.month:02}/{value.year:04}" if value else ""
+
+
+def timed(function: Callable, values: Iterable) -> float:
+    started = time.perf_counter()
+    for value in values:
+        function(value)
+    return time.perf_counter() - started
+
+
+def main(cells: int = CELLS) -> None:
+    rng = random.Random(0)
+    dates = [date(2019, 1, 1) + timedelta(days=x) for x in range(DISTINCT)]
+    strings = [format_date_uncached(rng.choice(dates)) for _ in range(cells)]
+    values = [parse_date_uncached(x) for x in strings]
+    print(f"{cells} cells, {DISTINCT} distinct dates")
+    for name, function, inputs in (
+        ("parse uncached", parse_date_uncached, strings),
+        ("parse cached", parse_date, strings),
+        ("format uncached", format_date_uncached, values),
+        ("format cached", format_date, values),
+    ):
+        print(f"{name:<16} | {timed(function, inputs):>8.3f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:2]))
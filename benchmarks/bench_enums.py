@@ -0,0 +1,65 @@
+import sys
+import time
+from typing import Callable
+
+from issuetruck.issue import (
+    PRIORITY_CELLS,
+    STATUS_CELLS,
+    TYPE_CELLS,
+    PriorityEnum,
+    StatusEnum,
+    TypeEnum,
+)
+from issuetruck.markdown import parse_priority, parse_status, parse_tcells, parse_type
+
+from .synthetic import generate_issues
+
+ROWS = 1_000_000
+
+
+def parse_legacy(rows: list[list[str]]) -> None:
+    for cells in rows:
+        StatusEnum(cells[0].strip())
+        PriorityEnum(cells[5].strip())
+        TypeEnum(cells[6].strip())
+
+
+def parse_lookup(rows: list[list[str]]) -> None:
+    for cells in rows:
+        parse_status(cells[0])
+        parse_priority(cells[5])
+        parse_type(cells[6])
+
+
+def render_legacy(rows: list[tuple]) -> None:
+    for status, priority, issue_type in rows:
+        f"| {status.value:<8} | {priority.value:<8} | {issue_type.value:<12} |"
+
+
+def render_lookup(rows: list[tuple]) -> None:
+    for status, priority, issue_type in rows:
+        f"| {STATUS_CELLS[status]} | {PRIORITY_CELLS[priority]} | {TYPE_CELLS[issue_type]} |"
+
+
+def timed(function: Callable, rows: list) -> float:
+    started = time.perf_counter()
+    function(rows)
+    return time.perf_counter() - started
+
+
+def main(count: int = ROWS) -> None:
+    issues = list(generate_issues(count))
+    cells = [parse_tcells(f"{issue._md_tdata}\n") for issue in issues]
+    members = [(issue.status, issue.priority, issue.type) for issue in issues]
+    print(f"{count} rows")
+    for name, function, rows in (
+        ("parse legacy", parse_legacy, cells),
+        ("parse lookup", parse_lookup, cells),
+        ("render legacy", render_legacy, members),
+        ("render lookup", render_lookup, members),
+    ):
+        print(f"{name:<14} | {timed(function, rows):>8.3f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:2]))
@@ -0,0 +1,108 @@
+import sys
+import time
+from functools import partial
+
+from issuetruck.compose import compose
+from issuetruck.index import IssueIndex
+from issuetruck.issue import (
+    Issue,
+    apply_filters,
+    filter_by_environment,
+    filter_by_milestone,
+    filter_by_priority_critical,
+    filter_by_priority_high,
+    filter_by_priority_low,
+    filter_by_priority_medium,
+    filter_by_status_canceled,
+    filter_by_status_closed,
+    filter_by_status_open,
+    filter_by_status_test,
+    filter_by_title,
+    filter_by_type_bug,
+    filter_by_type_experimental,
+    filter_by_type_feature,
+    filter_by_type_improvement,
+    filter_by_type_memo,
+)
+
+from .synthetic import generate_issues
+
+SIZE = 1_000_000
+COMBINATIONS: list[dict] = [
+    {},
+    {"is_open": True},
+    {"is_open": True, "bug": True},
+    {"is_open": True, "bug": True, "critical": True},
+    {"environment": "PROD", "milestone": "1."},
+    {"title": "CACHE"},
+    {"closed": True, "feature": True, "high": True, "milestone": "2.", "title": "men"},
+]
+
+
+def legacy_apply_filters(
+    issues: list[Issue],
+    is_open: bool = False,
+    closed: bool = False,
+    test: bool = False,
+    canceled: bool = False,
+    bug: bool = False,
+    feature: bool = False,
+    improvement: bool = False,
+    experimental: bool = False,
+    memo: bool = False,
+    low: bool = False,
+    medium: bool = False,
+    high: bool = False,
+    critical: bool = False,
+    environment=None,
+    milestone=None,
+    title=None,
+) -> list[Issue]:
+    return compose(
+        partial(filter_by_status_open, is_open=is_open),
+        partial(filter_by_status_closed, closed=closed),
+        partial(filter_by_status_test, test=test),
+        partial(filter_by_status_canceled, canceled=canceled),
+        partial(filter_by_type_bug, bug=bug),
+        partial(filter_by_type_feature, feature=feature),
+        partial(filter_by_type_improvement, improvement=improvement),
+        partial(filter_by_type_experimental, experimental=experimental),
+        partial(filter_by_type_memo, memo=memo),
+        partial(filter_by_priority_low, low=low),
+        partial(filter_by_priority_medium, medium=medium),
+        partial(filter_by_priority_high, high=high),
+        partial(filter_by_priority_critical, critical=critical),
+        partial(filter_by_environment, environment=environment),
+        partial(filter_by_milestone, milestone=milestone),
+        partial(filter_by_title, title=title),
+    )(issues)
+
+
+def elapsed(func, *args, **kwargs) -> tuple[float, list[Issue]]:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main(size: int = SIZE) -> None:
+    issues = list(generate_issues(size))
+    build, index = elapsed(IssueIndex, issues)
+    print(f"{size} issues, index built in {build:.3f}s")
+    print(
+        f"{'filters':<72} | {'matches':>8} | {'legacy s':>8} | {'fused s':>8}"
+        f" | {'index s':>8}"
+    )
+    for filters in COMBINATIONS:
+        before, expected = elapsed(legacy_apply_filters, issues, **filters)
+        after, result = elapsed(apply_filters, issues, **filters)
+        indexed, indexed_result = elapsed(index.apply_filters, **filters)
+        assert result == expected == indexed_result
+        label = ", ".join(f"{key}={value!r}" for key, value in filters.items())
+        print(
+            f"{label or '-':<72} | {len(result):>8} | {before:>8.3f} | {after:>8.3f}"
+            f" | {indexed:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else SIZE)
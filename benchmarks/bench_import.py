@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BUDGETS_US: dict[str, int] = {
+    "--version": 30_000,
+    "list --open (plain)": 150_000,
+    "list --open": 350_000,
+}
+
+
+def import_time_us(args: list[str], env: dict[str, str]) -> int:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **env},
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = str(Path(directory) / "ToDo.md")
+        runs = {
+            "--version": (["-m", "issuetruck", "--version"], {}),
+            "list --open (plain)": (
+                ["-m", "issuetruck", "list", "--open", "--filepath", filepath],
+                {"ISSUETRUCK_PLAIN": "1"},
+            ),
+            "list --open": (
+                ["-m", "issuetruck", "list", "--open", "--filepath", filepath],
+                {},
+            ),
+        }
+        exceeded = False
+        print(f"{'command':<22} | {'import us':>9} | {'budget us':>9}")
+        for label, (args, env) in runs.items():
+            total = import_time_us(args, env)
+            budget = BUDGETS_US[label]
+            exceeded = exceeded or total > budget
+            print(f"{label:<22} | {total:>9} | {budget:>9}")
+    return 1 if exceeded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
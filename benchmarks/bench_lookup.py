@@ -0,0 +1,52 @@
+import random
+import sys
+import time
+from typing import Callable
+
+from issuetruck.issue import Issue, IssueList, get_by_id
+
+from .synthetic import generate_issues
+
+SIZE = 1_000_000
+LOOKUPS = 10_000
+LEGACY_SAMPLE = 20
+
+
+def get_by_id_legacy(issues: list[Issue], issue_id: int) -> Issue | None:
+    try:
+        index = [issue.id for issue in issues].index(issue_id)
+    except ValueError:
+        return None
+    else:
+        return issues[index]
+
+
+def timed(lookup: Callable, issues: list[Issue], ids: list[int]) -> float:
+    started = time.perf_counter()
+    for issue_id in ids:
+        lookup(issues, issue_id)
+    return time.perf_counter() - started
+
+
+def main(size: int = SIZE, lookups: int = LOOKUPS) -> None:
+    rng = random.Random(0)
+    issues = list(generate_issues(size))
+    ids = [rng.randint(1, size) for _ in range(lookups)]
+    started = time.perf_counter()
+    indexed = IssueList(issues)
+    build = time.perf_counter() - started
+    sample = ids[:LEGACY_SAMPLE]
+    print(f"{lookups} lookups against {size} issues")
+    for name, lookup, container, keys in (
+        ("legacy list scan", get_by_id_legacy, issues, sample),
+        ("get_by_id on list", get_by_id, issues, sample),
+        ("IssueList", get_by_id, indexed, ids),
+    ):
+        elapsed = timed(lookup, container, keys) * lookups / len(keys)
+        print(f"{name:<18} | {elapsed:>9.3f}s")
+    print(f"{'IssueList build':<18} | {build:>9.3f}s")
+    print(f"Scans are extrapolated from {len(sample)} lookups")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:3]))
@@ -0,0 +1,52 @@
+import gc
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from typing import Callable, Iterable
+
+from issuetruck.issue import Issue
+from issuetruck.table import IssueTable
+
+from .synthetic import generate_issues
+
+SIZES = (1_000_000,)
+
+ISSUE_FIELDS = [field for field in fields(Issue) if field.init]
+
+DictIssue = make_dataclass(
+    "DictIssue", [(field.name, field.type, field) for field in ISSUE_FIELDS]
+)
+
+
+def as_dict_issues(issues: Iterable[Issue]) -> list:
+    return [
+        DictIssue(**{field.name: getattr(issue, field.name) for field in ISSUE_FIELDS})
+        for issue in issues
+    ]
+
+
+def traced_bytes(build: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        container = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del container
+    return current
+
+
+def main(sizes: tuple[int, ...] = SIZES) -> None:
+    print(f"{'issues':>10} | {'container':<16} | {'bytes/issue':>11}")
+    for size in sizes:
+        for name, build in (
+            ("dict dataclass", lambda: as_dict_issues(generate_issues(size))),
+            ("slotted Issue", lambda: list(generate_issues(size))),
+            ("IssueTable", lambda: IssueTable(generate_issues(size))),
+        ):
+            print(f"{size:>10} | {name:<16} | {traced_bytes(build) / size:>11.1f}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(x) for x in sys.argv[1:]) or SIZES)
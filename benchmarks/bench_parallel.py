@@ -0,0 +1,36 @@
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from issuetruck.markdown import parse_path
+from issuetruck.parallel import parse_path_parallel
+
+from .synthetic import write_todo
+
+SIZE_MB = 1024
+BYTES_PER_ISSUE = 380
+WORKERS = (1, 2, 4, 8)
+
+
+def main(size_mb: int = SIZE_MB) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = write_todo(
+            Path(directory) / "ToDo.md", size_mb * (1 << 20) // BYTES_PER_ISSUE
+        )
+        size = os.path.getsize(filepath) / (1 << 20)
+        print(f"{size:.0f} MiB, {os.cpu_count()} CPUs")
+        started = time.perf_counter()
+        expected = parse_path(filepath, cache=False)
+        print(f"{'serial':>10} | {time.perf_counter() - started:>8.2f}s")
+        for workers in WORKERS:
+            started = time.perf_counter()
+            issues = parse_path_parallel(filepath, workers)
+            elapsed = time.perf_counter() - started
+            assert issues == expected
+            print(f"{workers:>10} | {elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:2]))
@@ -0,0 +1,50 @@
+import re
+import sys
+import time
+
+from issuetruck.markdown import parse_line
+
+from .synthetic import generate_lines
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def legacy_parse_line(line: str) -> str:
+    if line.startswith("# "):
+        return "h1"
+    if line.startswith("## "):
+        return "h2"
+    if line.startswith("### "):
+        return "h3"
+    if re.match(r"\|\s+-+\s+\|", line):
+        return "tsep"
+    if re.match(r"\|\s+.*?\s+\|", line):
+        return "tdata"
+    if line.strip() == "":
+        return "empty"
+    if re.match(r"^\w+", line):
+        return "p"
+    if re.match(r"^- ", line):
+        return "li"
+    return "unknown"
+
+
+def lines_per_second(func, lines: list[str]) -> float:
+    start = time.perf_counter()
+    for line in lines:
+        func(line)
+    return len(lines) / (time.perf_counter() - start)
+
+
+def main(sizes: tuple[int, ...] = SIZES) -> None:
+    print(f"{'lines':>10} | {'legacy l/s':>12} | {'current l/s':>12} | speedup")
+    for size in sizes:
+        lines = generate_lines(size)
+        assert [legacy_parse_line(x) for x in lines] == [parse_line(x) for x in lines]
+        before = lines_per_second(legacy_parse_line, lines)
+        after = lines_per_second(parse_line, lines)
+        print(f"{size:>10} | {before:>12.0f} | {after:>12.0f} | {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main(tuple(int(x) for x in sys.argv[1:]) or SIZES)
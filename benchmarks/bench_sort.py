@@ -0,0 +1,47 @@
+import sys
+import time
+import tracemalloc
+from typing import Callable, Iterator
+
+from issuetruck.issue import Issue, iter_paginate
+from issuetruck.sort import SortEnum, sort_issues, sort_key
+
+from .synthetic import generate_issues
+
+SIZE = 200_000
+LIMIT = 20
+
+
+def full_sort(issues: Iterator[Issue], sort: SortEnum, limit: int) -> list[Issue]:
+    return list(iter_paginate(sorted(issues, key=sort_key(sort)), limit=limit))
+
+
+def top_k(issues: Iterator[Issue], sort: SortEnum, limit: int) -> list[Issue]:
+    return sort_issues(issues, sort, limit=limit)[0]
+
+
+def measure(select: Callable, size: int, sort: SortEnum, limit: int) -> tuple:
+    started = time.perf_counter()
+    page = select(generate_issues(size), sort, limit)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    select(generate_issues(size), sort, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return page, elapsed, peak
+
+
+def main(size: int = SIZE, limit: int = LIMIT) -> None:
+    print(f"Top {limit} of {size} streamed issues")
+    for sort in (SortEnum.PRIORITY, SortEnum.OPEN_DATE, SortEnum.MILESTONE):
+        expected, full, full_peak = measure(full_sort, size, sort, limit)
+        page, heap, heap_peak = measure(top_k, size, sort, limit)
+        assert page == expected
+        print(
+            f"{sort.value:<10} | sorted {full:>7.3f}s {full_peak / 2**20:>8.1f}MiB"
+            f" | top-k {heap:>7.3f}s {heap_peak / 2**20:>8.1f}MiB"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:3]))
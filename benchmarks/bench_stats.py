@@ -0,0 +1,26 @@
+import sys
+import time
+import tracemalloc
+
+from issuetruck.stats import compute_stats
+
+from .synthetic import generate_issues
+
+SIZES = (10_000, 100_000)
+
+
+def main(*sizes: int) -> None:
+    print("Streaming stats over generated issues")
+    for size in sizes or SIZES:
+        started = time.perf_counter()
+        compute_stats(generate_issues(size))
+        elapsed = time.perf_counter() - started
+        tracemalloc.start()
+        compute_stats(generate_issues(size))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{size:>9} issues | {elapsed:>7.3f}s | peak {peak / 2**10:>8.1f}KiB")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,60 @@
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator
+
+from issuetruck.issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+
+_EPOCH = date(2019, 1, 1)
+_ENVIRONMENTS = ("", "DEV", "TEST", "COLL", "PROD", "FE", "BE")
+_WORDS = ("parser", "login", "cache", "export", "table", "crash", "timeout", "menu")
+
+
+def generate_issues(count: int, seed: int = 0) -> Iterator[Issue]:
+    rng = random.Random(seed)
+    for issue_id in range(count, 0, -1):
+        status = rng.choice(list(StatusEnum))
+        open_date = _EPOCH + timedelta(days=rng.randrange(1500))
+        done_date = (
+            open_date + timedelta(days=rng.randrange(60))
+            if status != StatusEnum.OPEN
+            else None
+        )
+        close_date = (
+            done_date + timedelta(days=rng.randrange(30))
+            if done_date and status in (StatusEnum.CLOSED, StatusEnum.CANCELED)
+            else None
+        )
+        yield Issue(
+            id=issue_id,
+            title=" ".join(rng.choice(_WORDS) for _ in range(3)),
+            subtitle=rng.choice(("", "Reported by QA")),
+            status=status,
+            type=rng.choice(list(TypeEnum)),
+            priority=rng.choice(list(PriorityEnum)),
+            open_date=open_date,
+            done_date=done_date,
+            close_date=close_date,
+            environment=rng.choice(_ENVIRONMENTS),
+            milestone=f"{rng.randrange(3)}.{rng.randrange(10)}.{rng.randrange(10)}",
+            content="".join(
+                f"{open_date:%d/%m/%Y} - edit - {rng.choice(_WORDS)}\n"
+                for _ in range(rng.randrange(3))
+            ),
+        )
+
+
+def generate_lines(count: int, seed: int = 0) -> list[str]:
+    lines: list[str] = []
+    for issue in generate_issues(count, seed):
+        lines.extend(line + "\n" for line in str(issue).split("\n"))
+        if len(lines) >= count:
+            break
+    return lines[:count]
+
+
+def write_todo(filepath: Path, count: int, seed: int = 0) -> Path:
+    with open(filepath, "w", encoding="utf8") as file:
+        for issue in generate_issues(count, seed):
+            print(str(issue), file=file, end="")
+    return filepath
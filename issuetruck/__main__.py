@@ -1,4 +1,22 @@
-from .app import app
+import os
+import sys
+
+from . import __version__
+
+PLAIN_ENV = "ISSUETRUCK_PLAIN"
+
+
+def main() -> None:
+    if sys.argv[1:] == ["--version"]:
+        print(f"IssueTruck Version: {__version__}")
+        return
+    if os.environ.get(PLAIN_ENV):
+        for module in ("rich", "shellingham"):
+            sys.modules.setdefault(module, None)  # type: ignore
+    from .app import app
 
-if __name__ == "__main__":
     app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional
+
+from .issue import Issue, compile_filters
+from .markdown import iter_path
+from .sort import SortEnum, TopK, sort_key
+
+WORKERS = 8
+SKIP_DIRECTORIES = (".git", ".hg", ".svn", ".venv", "node_modules", "__pycache__")
+
+Source = tuple[Path, Issue]
+
+
+def discover(root: Path, name: str = "ToDo.md") -> Iterator[Path]:
+    for directory, directories, files in os.walk(root):
+        directories[:] = sorted(x for x in directories if x not in SKIP_DIRECTORIES)
+        if name in files:
+            yield Path(directory) / name
+
+
+def parse_source(filepath: Path) -> list[Issue]:
+    return list(iter_path(filepath, cache=False))
+
+
+async def iter_sources(
+    paths: Iterable[Path], workers: int = WORKERS, **filters: Any
+) -> AsyncIterator[Source]:
+    loop = asyncio.get_running_loop()
+    stream = compile_filters(**filters)
+    remaining = iter(paths)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque[tuple[Path, asyncio.Future[list[Issue]]]] = deque()
+
+        def submit() -> None:
+            path = next(remaining, None)
+            if path is not None:
+                pending.append(
+                    (path, loop.run_in_executor(executor, parse_source, path))
+                )
+
+        for _ in range(workers):
+            submit()
+        try:
+            while pending:
+                path, future = pending.popleft()
+                issues = await future
+                submit()
+                for issue in issues if stream is None else stream(issues):
+                    yield path, issue
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+async def paginate_sources(
+    sources: AsyncIterator[Source],
+    skip: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> list[Source]:
+    page: list[Source] = []
+    if limit is not None and limit <= 0:
+        return page
+    position = 0
+    async for source in sources:
+        position += 1
+        if skip is not None and position <= skip:
+            continue
+        page.append(source)
+        if limit is not None and len(page) >= limit:
+            break
+    return page
+
+
+async def sort_sources(
+    sources: AsyncIterator[Source],
+    sort: SortEnum,
+    reverse: bool = False,
+    skip: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> list[Source]:
+    key = sort_key(sort, reverse)
+    if limit is None:
+        ordered = [source async for source in sources]
+        ordered.sort(key=lambda source: key(source[1]))
+        return ordered[skip or 0 :]
+    top: TopK[Source] = TopK((skip or 0) + max(limit, 0))
+    async for source in sources:
+        top.push(key(source[1]), source)
+    return top.result()[skip or 0 :]
+
+
+def collect(
+    paths: Iterable[Path],
+    workers: int = WORKERS,
+    skip: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: Optional[SortEnum] = None,
+    reverse: bool = False,
+    **filters: Any,
+) -> list[Source]:
+    async def run() -> list[Source]:
+        sources = iter_sources(paths, workers, **filters)
+        try:
+            if sort is not None:
+                return await sort_sources(sources, sort, reverse, skip, limit)
+            return await paginate_sources(sources, skip, limit)
+        finally:
+            await sources.aclose()
+
+    return asyncio.run(run())
+
+
+def aggregate(
+    root: Path,
+    name: str = "ToDo.md",
+    workers: int = WORKERS,
+    skip: Optional[int] = None,
+    limit: Optional[int] = None,
+    sort: Optional[SortEnum] = None,
+    reverse: bool = False,
+    **filters: Any,
+) -> list[Source]:
+    return collect(discover(root, name), workers, skip, limit, sort, reverse, **filters)
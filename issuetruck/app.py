@@ -1,25 +1,29 @@
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
 import typer
 
 from . import __version__
+from .batch import BatchFormatEnum
 from .issue import (
     Issue,
     PriorityEnum,
     StatusEnum,
     TypeEnum,
-    apply_filters,
-    format_comment,
-    get_by_id,
-    get_new_id,
-    get_new_priority,
+    change_issue_status,
+    create_issue,
+    edit_issue,
+    filter_issues,
+    format_result,
+    iter_paginate,
     paginate,
     print_issues,
-    split_issues_to_archive,
 )
-from .markdown import dump_path, parse_path
+from .sort import SortEnum
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .lock import Stat
 
 DEFAULT_PATH = Path(".") / "ToDo.md"
 
@@ -35,6 +39,50 @@ def version_callback(
 app = typer.Typer(invoke_without_command=True, callback=version_callback)
 
 
+def forward_request(filepath: Path, command: str, args: dict) -> bool:
+    from .daemon import DaemonError, forward
+
+    try:
+        output = forward(filepath, command, args)
+    except DaemonError as error:
+        print(error)
+        raise typer.Exit(1)
+    if output is None:
+        return False
+    print(output, end="")
+    return True
+
+
+def update_issue(
+    filepath: Path, issue_id: int, update: Callable[[Issue], None]
+) -> bool:
+    from .journal import journal_enabled
+
+    if journal_enabled(filepath):
+        from .journal import append_journal, journal_issue, locked
+
+        with locked(filepath) as journal:
+            issue = journal_issue(filepath, issue_id)
+            if issue is None:
+                return False
+            update(issue)
+            append_journal(journal, [("update", issue)])
+        return True
+    from .lock import read_modify_write
+    from .reader import read_issue
+    from .writer import splice_path
+
+    def write(expected: Optional["Stat"]) -> bool:
+        issue = read_issue(filepath, issue_id)
+        if issue is None:
+            return False
+        update(issue)
+        splice_path(filepath, [issue], expected=expected)
+        return True
+
+    return read_modify_write(filepath, write)
+
+
 @app.command("create")
 def create_issue_cmd(
     title: str,
@@ -47,27 +95,56 @@ def create_issue_cmd(
     filepath: Path = typer.Option(DEFAULT_PATH),
     start: int = 1,
 ):
-    issues: list[Issue] = parse_path(filepath)
-    new_id = get_new_id(issues, start)
-    new_priority = get_new_priority(priority, issue_type)
-    new_issue = Issue(
-        id=new_id,
-        title=title,
-        status=StatusEnum.OPEN,
-        priority=new_priority,
-        type=issue_type,
-        open_date=date.today(),
-        subtitle=subtitle,
-        environment=environment,
-        milestone=milestone,
-        content=format_comment(date.today(), "create", comment, "\n\n")
-        if comment
-        else "",
-    )
-    issues.insert(0, new_issue)
-    dump_path(filepath, issues)
+    if forward_request(
+        filepath,
+        "create",
+        {
+            "title": title,
+            "priority": priority,
+            "issue_type": issue_type,
+            "subtitle": subtitle,
+            "environment": environment,
+            "milestone": milestone,
+            "comment": comment,
+            "start": start,
+        },
+    ):
+        return
+    from .ids import allocate_id
+    from .journal import journal_enabled
+
+    def new_issue() -> Issue:
+        return create_issue(
+            allocate_id(filepath, start),
+            title,
+            date.today(),
+            priority=priority,
+            issue_type=issue_type,
+            subtitle=subtitle,
+            environment=environment,
+            milestone=milestone,
+            comment=comment,
+        )
+
+    if journal_enabled(filepath):
+        from .journal import append_journal, locked
+
+        with locked(filepath) as journal:
+            issue = new_issue()
+            append_journal(journal, [("create", issue)])
+    else:
+        from .lock import read_modify_write
+        from .writer import splice_path
+
+        issue = new_issue()
+        read_modify_write(
+            filepath,
+            lambda expected: splice_path(
+                filepath, new_issues=[issue], expected=expected
+            ),
+        )
     print("Created new issue")
-    print(f"{new_issue.id} - {new_issue.title}")
+    print(f"{issue.id} - {issue.title}")
 
 
 @app.command("edit")
@@ -83,37 +160,40 @@ def edit_issue_cmd(
     comment: str = "",
     filepath: Path = typer.Option(DEFAULT_PATH),
 ):
-    issues: list[Issue] = parse_path(filepath)
-    issue = get_by_id(issues, issue_id)
-    if issue is None:
+    if forward_request(
+        filepath,
+        "edit",
+        {
+            "issue_id": issue_id,
+            "title": title,
+            "subtitle": subtitle,
+            "status": status,
+            "environment": environment,
+            "priority": priority,
+            "issue_type": issue_type,
+            "milestone": milestone,
+            "comment": comment,
+        },
+    ):
+        return
+
+    def update(issue: Issue) -> None:
+        edit_issue(
+            issue,
+            date.today(),
+            title=title,
+            subtitle=subtitle,
+            status=status,
+            environment=environment,
+            priority=priority,
+            issue_type=issue_type,
+            milestone=milestone,
+            comment=comment,
+        )
+
+    if not update_issue(filepath, issue_id, update):
         print(f"No issue found with id = {issue_id}")
         return
-    if status == StatusEnum.TEST and issue.status != StatusEnum.TEST:
-        issue.done_date = date.today()
-    if status == StatusEnum.CLOSED and issue.status != StatusEnum.CLOSED:
-        issue.close_date = date.today()
-    if status == StatusEnum.CANCELED and issue.status != StatusEnum.CANCELED:
-        issue.close_date = date.today()
-    if status == StatusEnum.OPEN:
-        issue.done_date = None
-        issue.close_date = None
-    if title is not None:
-        issue.title = title
-    if subtitle is not None:
-        issue.subtitle = subtitle
-    if status is not None:
-        issue.status = status
-    if environment is not None:
-        issue.environment = environment
-    if priority is not None:
-        issue.priority = priority
-    if issue_type is not None:
-        issue.type = issue_type
-    if milestone is not None:
-        issue.milestone = milestone
-    if comment:
-        issue.content += format_comment(date.today(), "edit", comment, "\n\n")
-    dump_path(filepath, issues)
     print(f"Modified issue with id = {issue_id}")
 
 
@@ -133,34 +213,127 @@ def list_issue_cmd(
     env: Optional[str] = None,
     mil: Optional[str] = None,
     tit: Optional[str] = None,
-    limit: Optional[int] = None,
-    skip: Optional[int] = None,
+    limit: Optional[int] = typer.Option(None, min=0),
+    skip: Optional[int] = typer.Option(None, min=0),
     filepath: Path = typer.Option(DEFAULT_PATH),
+    root: Optional[Path] = None,
+    workers: int = 8,
+    include_archives: bool = False,
+    sort: Optional[SortEnum] = None,
+    reverse: bool = False,
 ):
-    issues: list[Issue] = parse_path(filepath)
-    filtered_issues = apply_filters(
-        issues,
-        is_open=is_open,
-        closed=closed,
-        test=test,
-        canceled=canc,
-        bug=bug,
-        feature=feat,
-        improvement=imp,
-        low=low,
-        medium=med,
-        high=high,
-        critical=crit,
-        environment=env,
-        milestone=mil,
-        title=tit,
-    )
-    paginated_issues = paginate(filtered_issues, skip=skip, limit=limit)
-    print(f"Filter result {len(paginated_issues)}/{len(issues)}")
+    filters = {
+        "is_open": is_open,
+        "closed": closed,
+        "test": test,
+        "canceled": canc,
+        "bug": bug,
+        "feature": feat,
+        "improvement": imp,
+        "low": low,
+        "medium": med,
+        "high": high,
+        "critical": crit,
+        "environment": env,
+        "milestone": mil,
+        "title": tit,
+    }
+    if root is not None or include_archives:
+        from .aggregate import aggregate, collect
+
+        if root is not None:
+            sources = aggregate(
+                root, filepath.name, workers, skip, limit, sort, reverse, **filters
+            )
+        else:
+            from .manifest import select_archives
+
+            paths = [filepath, *select_archives(Path("."), **filters)]
+            sources = collect(paths, workers, skip, limit, sort, reverse, **filters)
+        exhausted = limit is None or len(sources) < limit
+        print(format_result(len(sources), exhausted=exhausted))
+        print("")
+        for source, issue in sources:
+            print(f"<!-- {source} -->")
+            print(issue)
+        return
+
+    if forward_request(
+        filepath,
+        "list",
+        {"skip": skip, "limit": limit, "sort": sort, "reverse": reverse, **filters},
+    ):
+        return
+    from .markdown import iter_path
+
+    scanned = 0
+
+    def scan() -> Iterator[Issue]:
+        nonlocal scanned
+        for issue in iter_path(filepath):
+            scanned += 1
+            yield issue
+
+    filtered_issues = filter_issues(scan(), **filters)
+    if sort is None:
+        paginated_issues = list(iter_paginate(filtered_issues, skip=skip, limit=limit))
+        exhausted = limit is None or next(filtered_issues, None) is None
+    else:
+        from .sort import sort_issues
+
+        paginated_issues, _ = sort_issues(filtered_issues, sort, reverse, skip, limit)
+        exhausted = True
+    print(format_result(len(paginated_issues), scanned, exhausted))
     print("")
     print_issues(paginated_issues)
 
 
+@app.command("search")
+def search_issue_cmd(
+    query: str,
+    title: bool = typer.Option(True, "--title/--no-title"),
+    content: bool = typer.Option(True, "--content/--no-content"),
+    limit: Optional[int] = typer.Option(None, min=0),
+    skip: Optional[int] = typer.Option(None, min=0),
+    filepath: Path = typer.Option(DEFAULT_PATH),
+):
+    if forward_request(
+        filepath,
+        "search",
+        {
+            "query": query,
+            "title": title,
+            "content": content,
+            "skip": skip,
+            "limit": limit,
+        },
+    ):
+        return
+    from .journal import journal_pending
+
+    if journal_pending(filepath):
+        from .markdown import parse_path
+        from .search import SearchIndex
+
+        index = SearchIndex()
+        matches = parse_path(filepath)
+        index.update(matches)
+        issue_ids = index.search(query, title=title, content=content)
+        matches = [issue for issue in matches if issue.id in issue_ids]
+    else:
+        from .reader import read_issues
+        from .search import load_search_index
+
+        issue_ids = load_search_index(filepath).search(
+            query, title=title, content=content
+        )
+        matches = read_issues(filepath, issue_ids)
+    issues = paginate(matches, skip=skip, limit=limit)
+    print(f"Search result {len(issues)}/{len(issue_ids)}")
+    print("")
+    print_issues(issues)
+
+
 @app.command("status")
 def change_status(
     issue_id: int,
@@ -171,46 +344,171 @@ def change_status(
     comment: str = "",
     filepath: Path = typer.Option(DEFAULT_PATH),
 ):
-    issues: list[Issue] = parse_path(filepath)
-    issue = get_by_id(issues, issue_id)
-    if issue is None:
+    if forward_request(
+        filepath,
+        "status",
+        {
+            "issue_id": issue_id,
+            "is_open": is_open,
+            "done": done,
+            "close": close,
+            "cancel": cancel,
+            "comment": comment,
+        },
+    ):
+        return
+
+    def update(issue: Issue) -> None:
+        change_issue_status(
+            issue,
+            date.today(),
+            is_open=is_open,
+            done=done,
+            close=close,
+            cancel=cancel,
+            comment=comment,
+        )
+
+    if not update_issue(filepath, issue_id, update):
         print(f"No issue found with id = {issue_id}")
         return
-    if is_open and issue.status != StatusEnum.OPEN:
-        issue.status = StatusEnum.OPEN
-        issue.close_date = None
-        issue.done_date = None
-    if done and issue.status != StatusEnum.TEST:
-        issue.status = StatusEnum.TEST
-        issue.done_date = date.today()
-    if close and issue.status != StatusEnum.CLOSED:
-        issue.status = StatusEnum.CLOSED
-        issue.close_date = date.today()
-    if cancel and issue.status != StatusEnum.CANCELED:
-        issue.status = StatusEnum.CANCELED
-        issue.close_date = date.today()
-    if comment:
-        issue.content += format_comment(date.today(), "status", comment, "\n\n")
-    dump_path(filepath, issues)
     print(f"Status set for issue with id = {issue_id}")
 
 
+@app.command("serve")
+def serve_cmd(
+    filepath: Path = typer.Option(DEFAULT_PATH),
+    jobs: int = 1,
+):
+    from .daemon import socket_path
+    from .server import serve
+
+    try:
+        server = serve(filepath, jobs)
+    except FileExistsError as error:
+        print(error)
+        raise typer.Exit(1)
+    print(f"Serving {filepath} on {socket_path(filepath)}")
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path(filepath).unlink(missing_ok=True)
+
+
+@app.command("batch")
+def batch_cmd(
+    source: Path = typer.Argument(Path("-")),
+    batch_format: Optional[BatchFormatEnum] = typer.Option(None, "--format"),
+    filepath: Path = typer.Option(DEFAULT_PATH),
+    start: int = 1,
+    jobs: int = 1,
+):
+    import sys
+    import time
+    from contextlib import nullcontext
+
+    from .batch import Batch, read_operations
+    from .ids import advance_high_water, high_water
+    from .journal import rewriting
+    from .lock import file_stat
+    from .markdown import parse_path
+    from .writer import write_path
+
+    if batch_format is None:
+        batch_format = (
+            BatchFormatEnum.CSV if source.suffix == ".csv" else BatchFormatEnum.JSONL
+        )
+
+    started = time.perf_counter()
+    with rewriting(filepath) as journal:
+        stat = file_stat(filepath)
+        batch = Batch(
+            parse_path(filepath, workers=jobs),
+            date.today(),
+            max(start, high_water(filepath) + 1),
+        )
+        total = 0
+        failed = 0
+        with (
+            nullcontext(sys.stdin)
+            if str(source) == "-"
+            else open(source, "r", encoding="utf8", newline="")
+        ) as file:
+            try:
+                for number, operation, issue, error in batch.run(
+                    read_operations(file, batch_format)
+                ):
+                    total += 1
+                    if issue is None:
+                        failed += 1
+                        print(f"{number} {operation.get('op')} failed: {error}")
+                    else:
+                        print(
+                            f"{number} {operation.get('op')} {issue.id} - {issue.title}"
+                        )
+            except ValueError as error:
+                print(f"Invalid batch input after operation {total}: {error}")
+                print("No changes written")
+                raise typer.Exit(1)
+        if total > failed:
+            write_path(filepath, batch.issues)
+            advance_high_water(filepath, stat, [batch.next_id - 1])
+            if journal is not None:
+                journal.truncate(0)
+    elapsed = time.perf_counter() - started
+    print(
+        f"Applied {total - failed}/{total} operations in {elapsed:.3f}s"
+        f" ({total / elapsed:.0f} operations/s)"
+    )
+
+
 @app.command("archive")
 def archive(
     filepath: Path = typer.Option(DEFAULT_PATH),
 ):
-    issues: list[Issue] = parse_path(filepath)
-    to_archive, to_keep = split_issues_to_archive(issues)
-    if not to_archive:
-        print("No issue to archive in current main file")
-        return
+    from .archive import archive_path, commit_archive, discard_archive, stage_archive
+    from .ids import high_water
+    from .journal import rewriting
+    from .manifest import record_archive
 
-    typer.confirm(
-        f"Confirm to apply the following changes: Archive {len(to_archive)}, Keep {len(to_keep)}",
-        abort=True,
-    )
-    today = date.today()
-    archive_file_path = Path(".") / f"ToDo-{today:%Y-%m-%d}.md"
-    archived_issues = parse_path(archive_file_path)
-    dump_path(archive_file_path, to_archive + archived_issues)
-    dump_path(filepath, to_keep)
+    archive_file_path = archive_path(date.today())
+    with rewriting(filepath) as journal:
+        high_water(filepath)
+        staged = stage_archive(filepath, archive_file_path, max_id=0)
+        try:
+            if not staged.archived:
+                print("No issue to archive in current main file")
+                return
+            typer.confirm(
+                f"Confirm to apply the following changes: Archive {staged.archived}, Keep {staged.kept}",
+                abort=True,
+            )
+            commit_archive(staged, filepath, archive_file_path)
+            record_archive(archive_file_path, staged.summary, staged.previous)
+            if journal is not None:
+                journal.truncate(0)
+        finally:
+            discard_archive(staged)
+
+
+@app.command("stats")
+def stats_cmd(
+    json_output: bool = typer.Option(False, "--json"),
+    filepath: Path = typer.Option(DEFAULT_PATH),
+):
+    from .stats import dump_stats, format_stats, stats_path
+
+    stats = stats_path(filepath)
+    print(dump_stats(stats) if json_output else format_stats(stats))
+
+
+@app.command("compact")
+def compact_cmd(
+    filepath: Path = typer.Option(DEFAULT_PATH),
+):
+    from .journal import compact
+
+    print(f"Compacted {compact(filepath)} journal records into {filepath}")
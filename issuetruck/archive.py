@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from .ids import advance_high_water
+from .issue import archive_condition
+from .lock import MISSING, Stat, file_stat
+from .manifest import ArchiveSummary, FileSignature, archive_signature
+from .markdown import iter_path
+from .writer import CHUNK_SIZE, copy_mode, encode_issue_block
+
+
+@dataclass(slots=True)
+class StagedArchive:
+    keep_path: str
+    archive_path: str
+    kept: int = 0
+    archived: int = 0
+    previous: Optional[FileSignature] = None
+    source: Stat = MISSING
+    summary: ArchiveSummary = field(default_factory=ArchiveSummary)
+
+
+def archive_path(today: date) -> Path:
+    return Path(".") / f"ToDo-{today:%Y-%m-%d}.md"
+
+
+def temporary_file(target: Path) -> BinaryIO:
+    return tempfile.NamedTemporaryFile(
+        "wb",
+        dir=os.path.dirname(os.path.abspath(target)),
+        prefix=".",
+        suffix=".tmp",
+        delete=False,
+    )
+
+
+def stage_archive(
+    filepath: Path, archive_filepath: Path, max_id: Optional[int] = None
+) -> StagedArchive:
+    if max_id is None:
+        max_id = max((issue.id for issue in iter_path(filepath)), default=0)
+    with temporary_file(filepath) as keep, temporary_file(archive_filepath) as archive:
+        staged = StagedArchive(
+            keep.name,
+            archive.name,
+            previous=archive_signature(archive_filepath),
+            source=file_stat(filepath),
+        )
+        try:
+            for issue in iter_path(filepath):
+                if archive_condition(issue, max_id):
+                    archive.write(encode_issue_block(issue))
+                    staged.archived += 1
+                    staged.summary.add(issue)
+                else:
+                    keep.write(encode_issue_block(issue))
+                    staged.kept += 1
+            if staged.archived and os.path.isfile(archive_filepath):
+                with open(archive_filepath, "rb") as existing:
+                    shutil.copyfileobj(existing, archive, CHUNK_SIZE)
+            for output in (keep, archive):
+                output.flush()
+                os.fsync(output.fileno())
+        except BaseException:
+            discard_archive(staged)
+            raise
+    return staged
+
+
+def commit_archive(
+    staged: StagedArchive, filepath: Path, archive_filepath: Path
+) -> None:
+    for source, target in (
+        (staged.archive_path, archive_filepath),
+        (staged.keep_path, filepath),
+    ):
+        copy_mode(target, source)
+    os.replace(staged.archive_path, archive_filepath)
+    os.replace(staged.keep_path, filepath)
+    advance_high_water(filepath, staged.source)
+
+
+def discard_archive(staged: StagedArchive) -> None:
+    for path in (staged.keep_path, staged.archive_path):
+        if os.path.exists(path):
+            os.unlink(path)
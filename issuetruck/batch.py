@@ -0,0 +1,144 @@
+from datetime import date
+from enum import Enum
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
+from .issue import (
+    Issue,
+    IssueList,
+    PriorityEnum,
+    StatusEnum,
+    TypeEnum,
+    change_issue_status,
+    create_issue,
+    edit_issue,
+    get_new_id,
+)
+
+Operation = dict[str, Any]
+
+TRUE_VALUES = ("1", "true", "yes", "y")
+
+
+class BatchFormatEnum(str, Enum):
+    JSONL = "jsonl"
+    CSV = "csv"
+
+
+class BatchError(Exception):
+    pass
+
+
+def read_operations(file: TextIO, batch_format: BatchFormatEnum) -> Iterator[Operation]:
+    import csv
+    import json
+
+    if batch_format == BatchFormatEnum.CSV:
+        for row in csv.DictReader(file):
+            yield {key: value for key, value in row.items() if value not in ("", None)}
+        return
+    for line in file:
+        if line.strip():
+            operation = json.loads(line)
+            if not isinstance(operation, dict):
+                raise ValueError(f"Expected a JSON object, got {line.strip()!r}")
+            yield operation
+
+
+def get_str(operation: Operation, key: str) -> Optional[str]:
+    value = operation.get(key)
+    return None if value is None else str(value)
+
+
+def get_flag(operation: Operation, key: str) -> bool:
+    value = operation.get(key, False)
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return bool(value)
+
+
+def get_enum(operation: Operation, key: str, enum: Any) -> Any:
+    value = operation.get(key)
+    return None if value is None else enum(value)
+
+
+class Batch:
+    def __init__(self, issues: list[Issue], today: date, start: int = 1) -> None:
+        self.issues = issues if isinstance(issues, IssueList) else IssueList(issues)
+        self.today = today
+        self.next_id = get_new_id(self.issues, start)
+
+    def get(self, operation: Operation) -> Issue:
+        if "id" not in operation:
+            raise BatchError("Missing id")
+        issue_id = int(operation["id"])
+        issue = self.issues.get(issue_id)
+        if issue is None:
+            raise BatchError(f"No issue found with id = {issue_id}")
+        return issue
+
+    def apply(self, operation: Operation) -> Issue:
+        kind = operation.get("op")
+        if kind == "create":
+            return self.create(operation)
+        if kind == "edit":
+            return self.edit(operation)
+        if kind == "status":
+            return self.status(operation)
+        raise BatchError(f"Unknown operation {kind!r}")
+
+    def create(self, operation: Operation) -> Issue:
+        title = get_str(operation, "title")
+        if not title:
+            raise BatchError("Missing title")
+        issue = create_issue(
+            self.next_id,
+            title,
+            self.today,
+            priority=get_enum(operation, "priority", PriorityEnum),
+            issue_type=get_enum(operation, "type", TypeEnum) or TypeEnum.BUG,
+            subtitle=get_str(operation, "subtitle") or "",
+            environment=get_str(operation, "environment") or "",
+            milestone=get_str(operation, "milestone") or "",
+            comment=get_str(operation, "comment") or "",
+        )
+        self.next_id += 1
+        self.issues.insert(0, issue)
+        return issue
+
+    def edit(self, operation: Operation) -> Issue:
+        issue = self.get(operation)
+        edit_issue(
+            issue,
+            self.today,
+            title=get_str(operation, "title"),
+            subtitle=get_str(operation, "subtitle"),
+            status=get_enum(operation, "status", StatusEnum),
+            environment=get_str(operation, "environment"),
+            priority=get_enum(operation, "priority", PriorityEnum),
+            issue_type=get_enum(operation, "type", TypeEnum),
+            milestone=get_str(operation, "milestone"),
+            comment=get_str(operation, "comment") or "",
+        )
+        return issue
+
+    def status(self, operation: Operation) -> Issue:
+        issue = self.get(operation)
+        change_issue_status(
+            issue,
+            self.today,
+            is_open=get_flag(operation, "open"),
+            done=get_flag(operation, "done"),
+            close=get_flag(operation, "close"),
+            cancel=get_flag(operation, "cancel"),
+            comment=get_str(operation, "comment") or "",
+        )
+        return issue
+
+    def run(
+        self, operations: Iterable[Operation]
+    ) -> Iterator[tuple[int, Operation, Optional[Issue], Optional[str]]]:
+        for number, operation in enumerate(operations, start=1):
+            try:
+                yield number, operation, self.apply(operation), None
+            except (BatchError, ValueError, TypeError) as error:
+                yield number, operation, None, str(error)
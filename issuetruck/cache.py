@@ -0,0 +1,128 @@
+import hashlib
+import marshal
+import os
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from .dates import from_ordinal, to_ordinal
+from .issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+
+CHUNK_SIZE = 1 << 20
+MAGIC = b"ITIDX\x01"
+HEADER = struct.Struct(f"<{len(MAGIC)}sqQ16s")
+BATCH_PREFIX = struct.Struct("<I")
+BATCH_SIZE = 1024
+STATUSES = list(StatusEnum)
+TYPES = list(TypeEnum)
+PRIORITIES = list(PriorityEnum)
+
+Signature = tuple[int, int, bytes]
+Record = tuple[int, str, int, int, int, int, str, str, str, int, int, str]
+
+
+def cache_path(filepath: Path) -> Path:
+    return Path(filepath).with_name(f".{Path(filepath).name}.idx")
+
+
+def encode_issue(issue: Issue) -> Record:
+    return (
+        issue.id,
+        issue.title,
+        to_ordinal(issue.open_date),
+        STATUSES.index(issue.status),
+        TYPES.index(issue.type),
+        PRIORITIES.index(issue.priority),
+        issue.subtitle,
+        issue.environment,
+        issue.milestone,
+        to_ordinal(issue.done_date),
+        to_ordinal(issue.close_date),
+        issue.content,
+    )
+
+
+def decode_issue(record: Record) -> Issue:
+    return Issue(
+        record[0],
+        record[1],
+        from_ordinal(record[2]),
+        STATUSES[record[3]],
+        TYPES[record[4]],
+        PRIORITIES[record[5]],
+        record[6],
+        record[7],
+        record[8],
+        from_ordinal(record[9]),
+        from_ordinal(record[10]),
+        record[11],
+    )
+
+
+def file_signature(filepath: Path) -> Signature:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, "rb") as file:
+        stat = os.fstat(file.fileno())
+        while chunk := file.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return stat.st_mtime_ns, stat.st_size, digest.digest()
+
+
+def iter_records(file: BinaryIO) -> Iterator[Record]:
+    while len(prefix := file.read(BATCH_PREFIX.size)) == BATCH_PREFIX.size:
+        (length,) = BATCH_PREFIX.unpack(prefix)
+        yield from marshal.loads(file.read(length))
+
+
+def write_batch(file: BinaryIO, records: list[Record]) -> None:
+    blob = marshal.dumps(records)
+    file.write(BATCH_PREFIX.pack(len(blob)))
+    file.write(blob)
+
+
+def iter_cache(filepath: Path, signature: Signature) -> Optional[Iterator[Issue]]:
+    try:
+        file = open(cache_path(filepath), "rb")
+    except OSError:
+        return None
+    if file.read(HEADER.size) != HEADER.pack(MAGIC, *signature):
+        file.close()
+        return None
+
+    def issues() -> Iterator[Issue]:
+        with file:
+            for record in iter_records(file):
+                yield decode_issue(record)
+
+    return issues()
+
+
+def write_cache(
+    filepath: Path, signature: Signature, issues: Iterable[Issue]
+) -> Iterator[Issue]:
+    target = cache_path(filepath)
+    temporary = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        file = open(temporary, "wb")
+    except OSError:
+        yield from issues
+        return
+    with file:
+        try:
+            file.write(HEADER.pack(MAGIC, *signature))
+            batch: list[Record] = []
+            for issue in issues:
+                batch.append(encode_issue(issue))
+                if len(batch) == BATCH_SIZE:
+                    write_batch(file, batch)
+                    batch.clear()
+                yield issue
+            write_batch(file, batch)
+        except BaseException:
+            file.close()
+            os.unlink(temporary)
+            raise
+    try:
+        os.replace(temporary, target)
+    except OSError:
+        os.unlink(temporary)
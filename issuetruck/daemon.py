@@ -0,0 +1,56 @@
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Optional
+
+DISABLE_ENV = "ISSUETRUCK_NO_DAEMON"
+TIMEOUT = 30.0
+READ_COMMANDS = ("list", "search")
+
+
+class DaemonError(Exception):
+    pass
+
+
+def socket_path(filepath: Path) -> Path:
+    return Path(filepath).with_name(f".{Path(filepath).name}.sock")
+
+
+def is_running(filepath: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path(filepath)))
+    except OSError:
+        return False
+    return True
+
+
+def forward(filepath: Path, command: str, args: dict[str, Any]) -> Optional[str]:
+    if not hasattr(socket, "AF_UNIX") or os.environ.get(DISABLE_ENV):
+        return None
+    path = socket_path(filepath)
+    if not path.exists():
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.settimeout(TIMEOUT)
+            client.connect(str(path))
+            client.sendall(
+                json.dumps({"command": command, "args": args}).encode("utf8") + b"\n"
+            )
+        except OSError:
+            return None
+        try:
+            with client.makefile("rb") as file:
+                response = json.loads(file.readline())
+        except (OSError, ValueError) as error:
+            if command in READ_COMMANDS:
+                return None
+            raise DaemonError(
+                f"No reply from the daemon on {path} ({type(error).__name__}),"
+                f" {command} may or may not have been applied"
+            ) from error
+    if "error" in response:
+        return f"Daemon error: {response['error']}\n"
+    return response["output"]
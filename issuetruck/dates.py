@@ -0,0 +1,27 @@
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+DATE_CACHE_SIZE = 1 << 12
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(date_value: str) -> Optional[date]:
+    parts = date_value.split("/")
+    if len(parts) != 3:
+        return None
+    return date(int(parts[2]), int(parts[1]), int(parts[0]))
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def format_date(value: Optional[date]) -> str:
+    return f"{value.day:02}/{value.month:02}/{value.year:04}" if value else ""
+
+
+def to_ordinal(value: Optional[date]) -> int:
+    return value.toordinal() if value else 0
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def from_ordinal(value: int) -> Optional[date]:
+    return date.fromordinal(value) if value else None
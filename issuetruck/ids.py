@@ -0,0 +1,75 @@
+import os
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .lock import Stat, file_lock, file_stat
+
+Mark = tuple[int, Stat]
+
+
+def id_path(filepath: Path) -> Path:
+    return Path(filepath).with_name(f".{Path(filepath).name}.id")
+
+
+def read_high_water(filepath: Path) -> Optional[Mark]:
+    try:
+        with open(id_path(filepath), "rb") as file:
+            value, *stat = (int(x) for x in file.read().split())
+    except (OSError, ValueError):
+        return None
+    if len(stat) != 3:
+        return None
+    return value, (stat[0], stat[1], stat[2])
+
+
+def write_high_water(filepath: Path, value: int, stat: Optional[Stat] = None) -> None:
+    if stat is None:
+        stat = file_stat(filepath)
+    path = id_path(filepath)
+    temporary = path.with_name(f"{path.name}.tmp")
+    with open(temporary, "wb") as file:
+        file.write(b"%d %d %d %d\n" % (value, *stat))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def scan_high_water(filepath: Path) -> int:
+    from .journal import journal_ids
+    from .manifest import load_manifest
+
+    archived = (summary.max_id for summary in load_manifest(Path(".")).values())
+    return max(chain(journal_ids(filepath), archived), default=0)
+
+
+def load_high_water(filepath: Path) -> Mark:
+    stat = file_stat(filepath)
+    mark = read_high_water(filepath)
+    if mark is not None and mark[1] == stat:
+        return mark
+    value = max(scan_high_water(filepath), 0 if mark is None else mark[0])
+    write_high_water(filepath, value, stat)
+    return value, stat
+
+
+def high_water(filepath: Path) -> int:
+    return load_high_water(filepath)[0]
+
+
+def allocate_id(filepath: Path, start: int = 1) -> int:
+    with file_lock(filepath):
+        value, stat = load_high_water(filepath)
+        issue_id = max(start, value + 1)
+        write_high_water(filepath, issue_id, stat)
+    return issue_id
+
+
+def advance_high_water(
+    filepath: Path, source: Stat, issue_ids: Iterable[int] = ()
+) -> None:
+    with file_lock(filepath):
+        mark = read_high_water(filepath)
+        if mark is None or mark[1] != source:
+            return
+        write_high_water(filepath, max(chain((mark[0],), issue_ids)))
@@ -0,0 +1,135 @@
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import chain
+from typing import Any, Optional
+
+from .issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+
+Posting = tuple[list[int], set[int]]
+EMPTY: Posting = ([], set())
+
+
+def build_postings(groups: dict[Any, list[int]]) -> dict[Any, Posting]:
+    return {value: (positions, set(positions)) for value, positions in groups.items()}
+
+
+class IssueIndex:
+    def __init__(self, issues: list[Issue]) -> None:
+        self.issues = issues
+        statuses: dict[StatusEnum, list[int]] = defaultdict(list)
+        types: dict[TypeEnum, list[int]] = defaultdict(list)
+        priorities: dict[PriorityEnum, list[int]] = defaultdict(list)
+        environments: dict[str, list[int]] = defaultdict(list)
+        milestones: dict[str, list[int]] = defaultdict(list)
+        for position, issue in enumerate(issues):
+            statuses[issue.status].append(position)
+            types[issue.type].append(position)
+            priorities[issue.priority].append(position)
+            environments[issue.environment].append(position)
+            milestones[issue.milestone].append(position)
+        self.statuses = build_postings(statuses)
+        self.types = build_postings(types)
+        self.priorities = build_postings(priorities)
+        self.environments = build_postings(environments)
+        self.milestones = dict(milestones)
+        self.milestone_keys = sorted(milestones)
+
+    def milestone_range(self, prefix: str) -> list[str]:
+        start = bisect_left(self.milestone_keys, prefix)
+        end = bisect_left(
+            self.milestone_keys, prefix[:-1] + chr(ord(prefix[-1]) + 1), start
+        )
+        return self.milestone_keys[start:end]
+
+    def milestone_count(self, prefix: str) -> int:
+        return sum(len(self.milestones[x]) for x in self.milestone_range(prefix))
+
+    def milestone_prefix(self, prefix: str) -> list[int]:
+        return sorted(
+            chain.from_iterable(
+                self.milestones[milestone] for milestone in self.milestone_range(prefix)
+            )
+        )
+
+    def apply_filters(
+        self,
+        is_open: bool = False,
+        closed: bool = False,
+        test: bool = False,
+        canceled: bool = False,
+        bug: bool = False,
+        feature: bool = False,
+        improvement: bool = False,
+        experimental: bool = False,
+        memo: bool = False,
+        low: bool = False,
+        medium: bool = False,
+        high: bool = False,
+        critical: bool = False,
+        environment: Optional[str] = None,
+        milestone: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> list[Issue]:
+        postings: list[Posting] = [
+            index.get(value, EMPTY)
+            for index, flags in (
+                (
+                    self.statuses,
+                    (
+                        (is_open, StatusEnum.OPEN),
+                        (closed, StatusEnum.CLOSED),
+                        (test, StatusEnum.TEST),
+                        (canceled, StatusEnum.CANCELED),
+                    ),
+                ),
+                (
+                    self.types,
+                    (
+                        (bug, TypeEnum.BUG),
+                        (feature, TypeEnum.FEATURE),
+                        (improvement, TypeEnum.IMPROVEMENT),
+                        (experimental, TypeEnum.EXPERIMENTAL),
+                        (memo, TypeEnum.MEMO),
+                    ),
+                ),
+                (
+                    self.priorities,
+                    (
+                        (low, PriorityEnum.LOW),
+                        (medium, PriorityEnum.MEDIUM),
+                        (high, PriorityEnum.HIGH),
+                        (critical, PriorityEnum.CRITICAL),
+                    ),
+                ),
+            )
+            for flag, value in flags
+            if flag
+        ]
+        if environment:
+            postings.append(self.environments.get(environment, EMPTY))
+        postings.sort(key=lambda posting: len(posting[0]))
+
+        if milestone and (
+            not postings or self.milestone_count(milestone) < len(postings[0][0])
+        ):
+            positions: Optional[list[int]] = self.milestone_prefix(milestone)
+            milestone = None
+        elif postings:
+            positions = postings.pop(0)[0]
+        else:
+            positions = None
+
+        if positions is None:
+            issues = self.issues
+        else:
+            for _, members in postings:
+                positions = [position for position in positions if position in members]
+            issues = [self.issues[position] for position in positions]
+        if milestone:
+            issues = [
+                issue for issue in issues if issue.milestone.startswith(milestone)
+            ]
+        if title:
+            needle = title.lower()
+            issues = [issue for issue in issues if needle in issue.title.lower()]
+        return issues
@@ -1,10 +1,20 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from functools import partial
-from typing import TYPE_CHECKING, Literal, Optional
-
-from .compose import compose
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    SupportsIndex,
+)
+
+from .dates import format_date
 
 if TYPE_CHECKING:  # pragma: no cover
     from _typeshed import SupportsWrite
@@ -32,7 +42,14 @@ class TypeEnum(str, Enum):
     MEMO = "Memo"
 
 
-@dataclass
+STATUS_CELLS = {status: f"{status.value:<8}" for status in StatusEnum}
+PRIORITY_CELLS = {priority: f"{priority.value:<8}" for priority in PriorityEnum}
+TYPE_CELLS = {issue_type: f"{issue_type.value:<12}" for issue_type in TypeEnum}
+MD_THEAD = "| Status   | Open date  | Done date  | Close date | Environment | Priority | Type         | Milestone   |"
+MD_TSEP = "| -------- | ---------- | ---------- | ---------- | ----------- | -------- | ------------ | ----------- |"
+
+
+@dataclass(slots=True)
 class Issue:
     id: int
     title: str
@@ -47,22 +64,12 @@ class Issue:
     close_date: Optional[date] = None
     content: str = ""
 
+    _rendered: Optional[tuple[tuple, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __str__(self) -> str:
-        return "\n".join(
-            x
-            for x in [
-                self._md_title,
-                self._md_subtitle or None,
-                "",
-                self._md_thead,
-                self._md_tsep,
-                self._md_tdata,
-                "",
-                self._md_content or None,
-                "" if not self._md_content else None,
-            ]
-            if x is not None
-        )
+        return render_issue(self)
 
     @property
     def _md_title(self) -> str:
@@ -74,11 +81,11 @@ class Issue:
 
     @property
     def _md_thead(self) -> str:
-        return "| Status   | Open date  | Done date  | Close date | Environment | Priority | Type         | Milestone   |"
+        return MD_THEAD
 
     @property
     def _md_tsep(self) -> str:
-        return "| -------- | ---------- | ---------- | ---------- | ----------- | -------- | ------------ | ----------- |"
+        return MD_TSEP
 
     @property
     def _md_status(self) -> str:
@@ -94,27 +101,15 @@ class Issue:
 
     @property
     def _md_open_date(self) -> str:
-        return (
-            f"{self.open_date.day:02}/{self.open_date.month:02}/{self.open_date.year:04}"
-            if self.open_date
-            else ""
-        )
+        return format_date(self.open_date)
 
     @property
     def _md_done_date(self) -> str:
-        return (
-            f"{self.done_date.day:02}/{self.done_date.month:02}/{self.done_date.year:04}"
-            if self.done_date
-            else ""
-        )
+        return format_date(self.done_date)
 
     @property
     def _md_close_date(self) -> str:
-        return (
-            f"{self.close_date.day:02}/{self.close_date.month:02}/{self.close_date.year:04}"
-            if self.close_date
-            else ""
-        )
+        return format_date(self.close_date)
 
     @property
     def _md_environment(self) -> str:
@@ -122,17 +117,114 @@ class Issue:
 
     @property
     def _md_tdata(self) -> str:
-        return f"| {self._md_status:<8} | {self._md_open_date} | {self._md_done_date:<10} | {self._md_close_date:<10} | {self._md_environment:<11} | {self._md_priority:<8} | {self._md_type:<12} | {self.milestone:<11} |"
+        return f"| {STATUS_CELLS[self.status]} | {self._md_open_date} | {self._md_done_date:<10} | {self._md_close_date:<10} | {self._md_environment:<11} | {PRIORITY_CELLS[self.priority]} | {TYPE_CELLS[self.type]} | {self.milestone:<11} |"
 
     @property
     def _md_content(self) -> str:
         return self.content
 
 
+def render_issue(issue: Issue) -> str:
+    key = (
+        issue.id,
+        issue.title,
+        issue.subtitle,
+        issue.status,
+        issue.open_date,
+        issue.done_date,
+        issue.close_date,
+        issue.environment,
+        issue.priority,
+        issue.type,
+        issue.milestone,
+        issue.content,
+    )
+    rendered = issue._rendered
+    if rendered is not None and rendered[0] == key:
+        return rendered[1]
+    subtitle = f"## {issue.subtitle}\n" if issue.subtitle else ""
+    content = f"\n{issue.content}" if issue.content else "\n"
+    text = (
+        f"# {issue.id} - {issue.title}\n{subtitle}\n{MD_THEAD}\n{MD_TSEP}\n"
+        f"| {STATUS_CELLS[issue.status]} | {format_date(issue.open_date)} "
+        f"| {format_date(issue.done_date):<10} | {format_date(issue.close_date):<10} "
+        f"| {issue.environment[:11]:<11} | {PRIORITY_CELLS[issue.priority]} "
+        f"| {TYPE_CELLS[issue.type]} | {issue.milestone:<11} |\n{content}"
+    )
+    issue._rendered = (key, text)
+    return text
+
+
+class IssueList(list[Issue]):
+    __slots__ = ("_by_id",)
+
+    def __init__(self, issues: Iterable[Issue] = ()) -> None:
+        super().__init__(issues)
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._by_id: dict[int, Issue] = {}
+        for issue in self:
+            self._by_id.setdefault(issue.id, issue)
+
+    def get(self, issue_id: int) -> Optional[Issue]:
+        return self._by_id.get(issue_id)
+
+    def append(self, issue: Issue) -> None:
+        super().append(issue)
+        self._by_id.setdefault(issue.id, issue)
+
+    def extend(self, issues: Iterable[Issue]) -> None:
+        for issue in issues:
+            self.append(issue)
+
+    def __iadd__(self, issues: Iterable[Issue]) -> "IssueList":
+        self.extend(issues)
+        return self
+
+    def insert(self, index: SupportsIndex, issue: Issue) -> None:
+        super().insert(index, issue)
+        if issue.id in self._by_id:
+            self._reindex()
+        else:
+            self._by_id[issue.id] = issue
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._reindex()
+
+    def pop(self, index: SupportsIndex = -1) -> Issue:
+        issue = super().pop(index)
+        self._reindex()
+        return issue
+
+    def remove(self, issue: Issue) -> None:
+        super().remove(issue)
+        self._reindex()
+
+    def clear(self) -> None:
+        super().clear()
+        self._by_id.clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._reindex()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._reindex()
+
+
 def get_new_id(issues: list[Issue], start: int = 1) -> int:
-    if len(issues) == 0:
-        return start
-    return max(start, max(issue.id for issue in issues) + 1)
+    return get_next_id((issue.id for issue in issues), start)
+
+
+def get_next_id(ids: Iterable[int], start: int = 1) -> int:
+    return max(start, max(ids, default=start - 1) + 1)
 
 
 def get_new_priority(
@@ -147,12 +239,9 @@ def get_new_priority(
 
 
 def get_by_id(issues: list[Issue], issue_id: int) -> Issue | None:
-    try:
-        index = [issue.id for issue in issues].index(issue_id)
-    except ValueError:
-        return None
-    else:
-        return issues[index]
+    if isinstance(issues, IssueList):
+        return issues.get(issue_id)
+    return next((issue for issue in issues if issue.id == issue_id), None)
 
 
 def filter_by_status_open(issues: list[Issue], is_open: bool) -> list[Issue]:
@@ -279,16 +368,18 @@ def filter_by_title(issues: list[Issue], title: Optional[str]) -> list[Issue]:
     )
 
 
-def split_issues_to_archive(issues: list[Issue]) -> tuple[list[Issue], list[Issue]]:
-    STATUS_TO_ARCHIVE = (StatusEnum.CLOSED, StatusEnum.CANCELED)
-    max_id = max(issue.id for issue in issues) if issues else 0
+STATUS_TO_ARCHIVE = (StatusEnum.CLOSED, StatusEnum.CANCELED)
 
-    def archive_condition(issue: Issue):
-        return issue.status in STATUS_TO_ARCHIVE and issue.id != max_id
 
+def archive_condition(issue: Issue, max_id: int) -> bool:
+    return issue.status in STATUS_TO_ARCHIVE and issue.id != max_id
+
+
+def split_issues_to_archive(issues: list[Issue]) -> tuple[list[Issue], list[Issue]]:
+    max_id = max(issue.id for issue in issues) if issues else 0
     return (
-        [issue for issue in issues if archive_condition(issue)],
-        [issue for issue in issues if not archive_condition(issue)],
+        IssueList(issue for issue in issues if archive_condition(issue, max_id)),
+        IssueList(issue for issue in issues if not archive_condition(issue, max_id)),
     )
 
 
@@ -311,29 +402,129 @@ def apply_filters(
     milestone: Optional[str] = None,
     title: Optional[str] = None,
 ) -> list[Issue]:
-    return compose(
-        partial(filter_by_status_open, is_open=is_open),
-        partial(filter_by_status_closed, closed=closed),
-        partial(filter_by_status_test, test=test),
-        partial(filter_by_status_canceled, canceled=canceled),
-        partial(filter_by_type_bug, bug=bug),
-        partial(filter_by_type_feature, feature=feature),
-        partial(filter_by_type_improvement, improvement=improvement),
-        partial(filter_by_type_experimental, experimental=experimental),
-        partial(filter_by_type_memo, memo=memo),
-        partial(filter_by_priority_low, low=low),
-        partial(filter_by_priority_medium, medium=medium),
-        partial(filter_by_priority_high, high=high),
-        partial(filter_by_priority_critical, critical=critical),
-        partial(filter_by_environment, environment=environment),
-        partial(filter_by_milestone, milestone=milestone),
-        partial(filter_by_title, title=title),
-    )(issues)
-
-
-def print_issues(issues: list[Issue], file: "SupportsWrite[str] | None" = None) -> None:
-    for issue in issues:
-        print(issue, file=file)
+    stream = compile_filters(
+        is_open=is_open,
+        closed=closed,
+        test=test,
+        canceled=canceled,
+        bug=bug,
+        feature=feature,
+        improvement=improvement,
+        experimental=experimental,
+        memo=memo,
+        low=low,
+        medium=medium,
+        high=high,
+        critical=critical,
+        environment=environment,
+        milestone=milestone,
+        title=title,
+    )
+    if stream is None:
+        return issues
+    return list(stream(issues))
+
+
+def compile_filters(
+    is_open: bool = False,
+    closed: bool = False,
+    test: bool = False,
+    canceled: bool = False,
+    bug: bool = False,
+    feature: bool = False,
+    improvement: bool = False,
+    experimental: bool = False,
+    memo: bool = False,
+    low: bool = False,
+    medium: bool = False,
+    high: bool = False,
+    critical: bool = False,
+    environment: Optional[str] = None,
+    milestone: Optional[str] = None,
+    title: Optional[str] = None,
+) -> Optional[Callable[[Iterable[Issue]], Iterator[Issue]]]:
+    statuses = {
+        status
+        for flag, status in (
+            (is_open, StatusEnum.OPEN),
+            (closed, StatusEnum.CLOSED),
+            (test, StatusEnum.TEST),
+            (canceled, StatusEnum.CANCELED),
+        )
+        if flag
+    }
+    types = {
+        issue_type
+        for flag, issue_type in (
+            (bug, TypeEnum.BUG),
+            (feature, TypeEnum.FEATURE),
+            (improvement, TypeEnum.IMPROVEMENT),
+            (experimental, TypeEnum.EXPERIMENTAL),
+            (memo, TypeEnum.MEMO),
+        )
+        if flag
+    }
+    priorities = {
+        priority
+        for flag, priority in (
+            (low, PriorityEnum.LOW),
+            (medium, PriorityEnum.MEDIUM),
+            (high, PriorityEnum.HIGH),
+            (critical, PriorityEnum.CRITICAL),
+        )
+        if flag
+    }
+    if not (statuses or types or priorities or environment or milestone or title):
+        return None
+    if len(statuses) > 1 or len(types) > 1 or len(priorities) > 1:
+        return lambda issues: iter(())
+
+    predicates: list[Callable[[Issue], bool]] = []
+    if statuses:
+        status = statuses.pop()
+        predicates.append(lambda issue: issue.status == status)
+    if types:
+        issue_type = types.pop()
+        predicates.append(lambda issue: issue.type == issue_type)
+    if priorities:
+        priority = priorities.pop()
+        predicates.append(lambda issue: issue.priority == priority)
+    if environment:
+        predicates.append(lambda issue: issue.environment == environment)
+    if milestone:
+        predicates.append(lambda issue: issue.milestone.startswith(milestone))
+    if title:
+        needle = title.lower()
+        predicates.append(lambda issue: needle in issue.title.lower())
+
+    def stream(issues: Iterable[Issue]) -> Iterator[Issue]:
+        matches = iter(issues)
+        for predicate in predicates:
+            matches = filter(predicate, matches)
+        return matches
+
+    return stream
+
+
+def filter_issues(issues: Iterable[Issue], **filters: Any) -> Iterator[Issue]:
+    stream = compile_filters(**filters)
+    return iter(issues) if stream is None else stream(issues)
+
+
+def format_result(
+    count: int, total: Optional[int] = None, exhausted: bool = True
+) -> str:
+    if not exhausted:
+        return f"Filter result {count}+"
+    return f"Filter result {count}" + ("" if total is None else f"/{total}")
+
+
+def print_issues(
+    issues: Iterable[Issue], file: "SupportsWrite[str] | None" = None
+) -> None:
+    text = "".join([f"{render_issue(issue)}\n" for issue in issues])
+    if text:
+        (sys.stdout if file is None else file).write(text)
 
 
 def format_comment(
@@ -345,6 +536,96 @@ def format_comment(
     return f"{today.day:02}/{today.month:02}/{today.year:04} - {operation} - {message}{end}"
 
 
+def create_issue(
+    issue_id: int,
+    title: str,
+    today: date,
+    priority: Optional[PriorityEnum] = None,
+    issue_type: TypeEnum = TypeEnum.BUG,
+    subtitle: str = "",
+    environment: str = "",
+    milestone: str = "",
+    comment: str = "",
+) -> Issue:
+    return Issue(
+        id=issue_id,
+        title=title,
+        status=StatusEnum.OPEN,
+        priority=get_new_priority(priority, issue_type),
+        type=issue_type,
+        open_date=today,
+        subtitle=subtitle,
+        environment=environment,
+        milestone=milestone,
+        content=format_comment(today, "create", comment, "\n\n") if comment else "",
+    )
+
+
+def edit_issue(
+    issue: Issue,
+    today: date,
+    title: Optional[str] = None,
+    subtitle: Optional[str] = None,
+    status: Optional[StatusEnum] = None,
+    environment: Optional[str] = None,
+    priority: Optional[PriorityEnum] = None,
+    issue_type: Optional[TypeEnum] = None,
+    milestone: Optional[str] = None,
+    comment: str = "",
+) -> None:
+    if status == StatusEnum.TEST and issue.status != StatusEnum.TEST:
+        issue.done_date = today
+    if status == StatusEnum.CLOSED and issue.status != StatusEnum.CLOSED:
+        issue.close_date = today
+    if status == StatusEnum.CANCELED and issue.status != StatusEnum.CANCELED:
+        issue.close_date = today
+    if status == StatusEnum.OPEN:
+        issue.done_date = None
+        issue.close_date = None
+    if title is not None:
+        issue.title = title
+    if subtitle is not None:
+        issue.subtitle = subtitle
+    if status is not None:
+        issue.status = status
+    if environment is not None:
+        issue.environment = environment
+    if priority is not None:
+        issue.priority = priority
+    if issue_type is not None:
+        issue.type = issue_type
+    if milestone is not None:
+        issue.milestone = milestone
+    if comment:
+        issue.content += format_comment(today, "edit", comment, "\n\n")
+
+
+def change_issue_status(
+    issue: Issue,
+    today: date,
+    is_open: bool = False,
+    done: bool = False,
+    close: bool = False,
+    cancel: bool = False,
+    comment: str = "",
+) -> None:
+    if is_open and issue.status != StatusEnum.OPEN:
+        issue.status = StatusEnum.OPEN
+        issue.close_date = None
+        issue.done_date = None
+    if done and issue.status != StatusEnum.TEST:
+        issue.status = StatusEnum.TEST
+        issue.done_date = today
+    if close and issue.status != StatusEnum.CLOSED:
+        issue.status = StatusEnum.CLOSED
+        issue.close_date = today
+    if cancel and issue.status != StatusEnum.CANCELED:
+        issue.status = StatusEnum.CANCELED
+        issue.close_date = today
+    if comment:
+        issue.content += format_comment(today, "status", comment, "\n\n")
+
+
 def paginate(
     issues: list[Issue], skip: Optional[int] = None, limit: Optional[int] = None
 ) -> list[Issue]:
@@ -354,3 +635,10 @@ def paginate(
     if limit is not None:
         paginated = paginated[:limit]
     return paginated
+
+
+def iter_paginate(
+    issues: Iterable[Issue], skip: Optional[int] = None, limit: Optional[int] = None
+) -> Iterator[Issue]:
+    start = max(skip or 0, 0)
+    return islice(issues, start, None if limit is None else start + max(limit, 0))
@@ -0,0 +1,131 @@
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Literal, Optional
+
+from .cache import decode_issue, encode_issue
+from .issue import Issue
+from .lock import file_lock
+
+JOURNAL_ENV = "ISSUETRUCK_JOURNAL"
+
+Operation = Literal["create", "update"]
+Entry = tuple[Operation, Issue]
+
+
+def journal_path(filepath: Path) -> Path:
+    return Path(filepath).with_name(f"{Path(filepath).name}.journal")
+
+
+def journal_pending(filepath: Path) -> bool:
+    try:
+        return os.path.getsize(journal_path(filepath)) > 0
+    except OSError:
+        return False
+
+
+def journal_enabled(filepath: Path) -> bool:
+    return bool(os.environ.get(JOURNAL_ENV)) or journal_pending(filepath)
+
+
+@contextmanager
+def locked(filepath: Path) -> Iterator[BinaryIO]:
+    with file_lock(filepath):
+        with open(journal_path(filepath), "ab") as journal:
+            yield journal
+
+
+def iter_journal(filepath: Path, issues: Iterable[Issue]) -> Iterator[Issue]:
+    if not journal_pending(filepath):
+        yield from issues
+        return
+    with file_lock(filepath, shared=True):
+        yield from apply_journal(issues, read_journal(filepath))
+
+
+@contextmanager
+def rewriting(filepath: Path) -> Iterator[Optional[BinaryIO]]:
+    if not journal_enabled(filepath):
+        with file_lock(filepath):
+            yield None
+        return
+    with locked(filepath) as journal:
+        yield journal
+
+
+def read_journal(filepath: Path) -> list[Entry]:
+    import json
+
+    try:
+        with open(journal_path(filepath), "rb") as file:
+            lines = file.read().splitlines(keepends=True)
+    except FileNotFoundError:
+        return []
+    entries: list[Entry] = []
+    for line in lines:
+        if not line.endswith(b"\n"):
+            break
+        operation, *record = json.loads(line)
+        entries.append((operation, decode_issue(tuple(record))))
+    return entries
+
+
+def append_journal(journal: BinaryIO, entries: Iterable[Entry]) -> None:
+    import json
+
+    journal.write(
+        b"".join(
+            json.dumps([operation, *encode_issue(issue)]).encode("utf8") + b"\n"
+            for operation, issue in entries
+        )
+    )
+    journal.flush()
+    os.fsync(journal.fileno())
+
+
+def fold_journal(entries: Iterable[Entry]) -> tuple[list[Issue], dict[int, Issue]]:
+    latest: dict[int, Issue] = {}
+    created: list[int] = []
+    for operation, issue in entries:
+        if operation == "create" and issue.id not in latest:
+            created.append(issue.id)
+        latest[issue.id] = issue
+    new_issues = [latest.pop(issue_id) for issue_id in reversed(created)]
+    return new_issues, latest
+
+
+def apply_journal(issues: Iterable[Issue], entries: Iterable[Entry]) -> Iterator[Issue]:
+    new_issues, updates = fold_journal(entries)
+    yield from new_issues
+    for issue in issues:
+        yield updates.get(issue.id, issue)
+
+
+def journal_issue(filepath: Path, issue_id: int) -> Optional[Issue]:
+    from .reader import read_issue
+
+    for _, issue in reversed(read_journal(filepath)):
+        if issue.id == issue_id:
+            return issue
+    return read_issue(filepath, issue_id)
+
+
+def journal_ids(filepath: Path) -> Iterator[int]:
+    from .reader import read_offset_index
+
+    yield from read_offset_index(filepath)
+    for _, issue in read_journal(filepath):
+        yield issue.id
+
+
+def compact(filepath: Path) -> int:
+    from .writer import splice_path
+
+    with locked(filepath) as journal:
+        entries = read_journal(filepath)
+        if not entries:
+            return 0
+        new_issues, updates = fold_journal(entries)
+        splice_path(filepath, updates.values(), new_issues)
+        journal.truncate(0)
+    return len(entries)
@@ -0,0 +1,82 @@
+import fcntl
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional, TypeVar
+
+OPTIMISTIC_ENV = "ISSUETRUCK_OPTIMISTIC"
+RETRIES = 50
+BACKOFF = 0.005
+
+Stat = tuple[int, int, int]
+MISSING: Stat = (0, 0, 0)
+T = TypeVar("T")
+
+_held: set[str] = set()
+
+
+class ConflictError(Exception):
+    pass
+
+
+def lock_path(filepath: Path) -> Path:
+    return Path(filepath).with_name(f".{Path(filepath).name}.lock")
+
+
+def stat_key(stat: os.stat_result) -> Stat:
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def file_stat(filepath: Path) -> Stat:
+    try:
+        return stat_key(os.stat(filepath))
+    except FileNotFoundError:
+        return MISSING
+
+
+@contextmanager
+def file_lock(filepath: Path, shared: bool = False) -> Iterator[None]:
+    path = os.path.abspath(lock_path(filepath))
+    if path in _held:
+        yield
+        return
+    try:
+        lock = open(path, "rb" if shared else "ab")
+    except FileNotFoundError:
+        if not shared:
+            raise
+        yield
+        return
+    with lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        _held.add(path)
+        try:
+            yield
+        finally:
+            _held.discard(path)
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def check_stat(filepath: Path, expected: Optional[Stat]) -> None:
+    if expected is not None and file_stat(filepath) != expected:
+        raise ConflictError(f"{filepath} was modified concurrently")
+
+
+def read_modify_write(
+    filepath: Path,
+    operation: Callable[[Optional[Stat]], T],
+    optimistic: Optional[bool] = None,
+) -> T:
+    if optimistic is None:
+        optimistic = bool(os.environ.get(OPTIMISTIC_ENV))
+    if optimistic:
+        import random
+        import time
+
+        for attempt in range(RETRIES):
+            try:
+                return operation(file_stat(filepath))
+            except ConflictError:
+                time.sleep(random.uniform(0, BACKOFF * (attempt + 1)))
+    with file_lock(filepath):
+        return operation(None)
@@ -0,0 +1,225 @@
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from .issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+from .markdown import iter_path
+from .writer import copy_mode
+
+ARCHIVE_GLOB = "ToDo-[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9].md"
+MANIFEST_NAME = ".ToDo-archives.json"
+MANIFEST_VERSION = 1
+
+FileSignature = tuple[int, int]
+
+
+@dataclass(slots=True)
+class ArchiveSummary:
+    signature: FileSignature = (0, 0)
+    count: int = 0
+    min_id: int = 0
+    max_id: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+    types: dict[str, int] = field(default_factory=dict)
+    priorities: dict[str, int] = field(default_factory=dict)
+    environments: list[str] = field(default_factory=list)
+    milestones: list[str] = field(default_factory=list)
+    first_open: Optional[str] = None
+    last_open: Optional[str] = None
+    last_close: Optional[str] = None
+
+    def add(self, issue: Issue) -> None:
+        self.min_id = issue.id if not self.count else min(self.min_id, issue.id)
+        self.max_id = issue.id if not self.count else max(self.max_id, issue.id)
+        self.count += 1
+        for counts, member in (
+            (self.statuses, issue.status),
+            (self.types, issue.type),
+            (self.priorities, issue.priority),
+        ):
+            counts[member.value] = counts.get(member.value, 0) + 1
+        if issue.environment not in self.environments:
+            self.environments.append(issue.environment)
+        if issue.milestone not in self.milestones:
+            self.milestones.append(issue.milestone)
+        if issue.open_date:
+            opened = issue.open_date.isoformat()
+            self.first_open = min(self.first_open or opened, opened)
+            self.last_open = max(self.last_open or opened, opened)
+        if issue.close_date:
+            self.last_close = max(self.last_close or "", issue.close_date.isoformat())
+
+    def merge(self, other: "ArchiveSummary") -> None:
+        if not other.count:
+            return
+        self.min_id = other.min_id if not self.count else min(self.min_id, other.min_id)
+        self.max_id = other.max_id if not self.count else max(self.max_id, other.max_id)
+        self.count += other.count
+        for counts, others in (
+            (self.statuses, other.statuses),
+            (self.types, other.types),
+            (self.priorities, other.priorities),
+        ):
+            for key, count in others.items():
+                counts[key] = counts.get(key, 0) + count
+        self.environments.extend(
+            x for x in other.environments if x not in self.environments
+        )
+        self.milestones.extend(x for x in other.milestones if x not in self.milestones)
+        self.first_open = min(
+            filter(None, (self.first_open, other.first_open)), default=None
+        )
+        self.last_open = max(
+            filter(None, (self.last_open, other.last_open)), default=None
+        )
+        self.last_close = max(
+            filter(None, (self.last_close, other.last_close)), default=None
+        )
+
+    def may_match(
+        self,
+        is_open: bool = False,
+        closed: bool = False,
+        test: bool = False,
+        canceled: bool = False,
+        bug: bool = False,
+        feature: bool = False,
+        improvement: bool = False,
+        experimental: bool = False,
+        memo: bool = False,
+        low: bool = False,
+        medium: bool = False,
+        high: bool = False,
+        critical: bool = False,
+        environment: Optional[str] = None,
+        milestone: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> bool:
+        for counts, flags in (
+            (
+                self.statuses,
+                (
+                    (is_open, StatusEnum.OPEN),
+                    (closed, StatusEnum.CLOSED),
+                    (test, StatusEnum.TEST),
+                    (canceled, StatusEnum.CANCELED),
+                ),
+            ),
+            (
+                self.types,
+                (
+                    (bug, TypeEnum.BUG),
+                    (feature, TypeEnum.FEATURE),
+                    (improvement, TypeEnum.IMPROVEMENT),
+                    (experimental, TypeEnum.EXPERIMENTAL),
+                    (memo, TypeEnum.MEMO),
+                ),
+            ),
+            (
+                self.priorities,
+                (
+                    (low, PriorityEnum.LOW),
+                    (medium, PriorityEnum.MEDIUM),
+                    (high, PriorityEnum.HIGH),
+                    (critical, PriorityEnum.CRITICAL),
+                ),
+            ),
+        ):
+            for flag, member in flags:
+                if flag and not counts.get(member.value):
+                    return False
+        if environment and environment not in self.environments:
+            return False
+        if milestone and not any(x.startswith(milestone) for x in self.milestones):
+            return False
+        return self.count > 0
+
+
+def manifest_path(directory: Path) -> Path:
+    return Path(directory) / MANIFEST_NAME
+
+
+def archive_signature(filepath: Path) -> Optional[FileSignature]:
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def summarize(filepath: Path) -> ArchiveSummary:
+    summary = ArchiveSummary(archive_signature(filepath) or (0, 0))
+    for issue in iter_path(filepath, cache=False):
+        summary.add(issue)
+    return summary
+
+
+def read_manifest(directory: Path) -> dict[str, ArchiveSummary]:
+    try:
+        with open(manifest_path(directory), "r", encoding="utf8") as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return {
+        name: ArchiveSummary(**{**entry, "signature": tuple(entry["signature"])})
+        for name, entry in data["archives"].items()
+    }
+
+
+def write_manifest(directory: Path, manifest: dict[str, ArchiveSummary]) -> None:
+    with tempfile.NamedTemporaryFile(
+        "w", dir=directory, prefix=".", suffix=".tmp", delete=False, encoding="utf8"
+    ) as file:
+        json.dump(
+            {
+                "version": MANIFEST_VERSION,
+                "archives": {name: asdict(x) for name, x in sorted(manifest.items())},
+            },
+            file,
+        )
+    copy_mode(manifest_path(directory), file.name)
+    os.replace(file.name, manifest_path(directory))
+
+
+def load_manifest(directory: Path) -> dict[str, ArchiveSummary]:
+    stored = read_manifest(directory)
+    manifest: dict[str, ArchiveSummary] = {}
+    for path in Path(directory).glob(ARCHIVE_GLOB):
+        summary = stored.get(path.name)
+        if summary is None or summary.signature != archive_signature(path):
+            summary = summarize(path)
+        manifest[path.name] = summary
+    if manifest != stored:
+        write_manifest(directory, manifest)
+    return manifest
+
+
+def record_archive(
+    filepath: Path, archived: ArchiveSummary, previous: Optional[FileSignature]
+) -> None:
+    directory = Path(filepath).parent
+    manifest = read_manifest(directory)
+    summary = manifest.pop(filepath.name, None)
+    if previous is None:
+        summary = archived
+    elif summary is not None and summary.signature == previous:
+        summary.merge(archived)
+    else:
+        summary = None
+    if summary is not None:
+        summary.signature = archive_signature(filepath) or (0, 0)
+        manifest[filepath.name] = summary
+    write_manifest(directory, manifest)
+
+
+def select_archives(directory: Path, **filters: Any) -> list[Path]:
+    return [
+        Path(directory) / name
+        for name, summary in sorted(load_manifest(directory).items(), reverse=True)
+        if summary.may_match(**filters)
+    ]
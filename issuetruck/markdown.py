@@ -1,31 +1,87 @@
 import os
 import re
 from datetime import date
-from io import TextIOWrapper
 from pathlib import Path
-from typing import Literal
-
-from .issue import Issue, PriorityEnum, StatusEnum, TypeEnum
-
-
-def parse_path(filepath: Path) -> list[Issue]:
+from typing import Iterable, Iterator, Literal
+
+from .cache import file_signature, iter_cache, write_cache
+from .dates import parse_date
+from .issue import (
+    PRIORITY_CELLS,
+    STATUS_CELLS,
+    TYPE_CELLS,
+    Issue,
+    IssueList,
+    PriorityEnum,
+    StatusEnum,
+    TypeEnum,
+    render_issue,
+)
+from .journal import apply_journal, iter_journal, journal_pending, read_journal
+from .lock import file_lock
+
+
+def parse_path(filepath: Path, cache: bool = True, workers: int = 1) -> IssueList:
+    if workers == 1 or not os.path.isfile(filepath):
+        return IssueList(iter_path(filepath, cache))
+    if journal_pending(filepath):
+        with file_lock(filepath, shared=True):
+            return IssueList(
+                apply_journal(
+                    parse_snapshot(filepath, cache, workers), read_journal(filepath)
+                )
+            )
+    return IssueList(parse_snapshot(filepath, cache, workers))
+
+
+def parse_snapshot(filepath: Path, cache: bool, workers: int) -> list[Issue]:
+    from .parallel import parse_path_parallel
+
+    if not cache:
+        return parse_path_parallel(filepath, workers)
+    signature = file_signature(filepath)
+    cached = iter_cache(filepath, signature)
+    if cached is not None:
+        return list(cached)
+    issues = parse_path_parallel(filepath, workers)
+    return list(write_cache(filepath, signature, issues))
+
+
+def iter_path(filepath: Path, cache: bool = True) -> Iterator[Issue]:
+    return iter_journal(filepath, iter_snapshot(filepath, cache))
+
+
+def iter_snapshot(filepath: Path, cache: bool = True) -> Iterator[Issue]:
     if not os.path.isfile(filepath):
-        return []
+        return
+    if not cache:
+        with open(filepath, "r", encoding="utf8") as file:
+            yield from iter_issues(file)
+        return
+    signature = file_signature(filepath)
+    cached = iter_cache(filepath, signature)
+    if cached is not None:
+        yield from cached
+        return
     with open(filepath, "r", encoding="utf8") as file:
-        return parse_file(file)
+        yield from write_cache(filepath, signature, iter_issues(file))
+
 
+def parse_file(file: Iterable[str]) -> IssueList:
+    return IssueList(iter_issues(file))
 
-def parse_file(file: TextIOWrapper) -> list[Issue]:
-    issues: list[Issue] = []
+
+def iter_issues(file: Iterable[str]) -> Iterator[Issue]:
     current = None
     _tdata = False
     _content = False
     for line in file:
         tag = parse_line(line)
         if tag == "h1":
+            if current is not None:
+                yield current
             issue_id, title = parse_h1(line)
             current = Issue(id=issue_id, title=title)
-            issues.append(current)
             _tdata = False
             _content = False
         if tag == "h2" and current:
@@ -33,7 +89,7 @@ def parse_file(file: TextIOWrapper) -> list[Issue]:
         if tag == "tsep":
             _tdata = True
         if tag == "tdata" and _tdata and current:
-            parts = parse_tvalues(parse_tdata(line))
+            parts = parse_tvalues(parse_tcells(line))
             current.status = parts[0]
             current.open_date = parts[1]
             current.done_date = parts[2]
@@ -47,28 +103,53 @@ def parse_file(file: TextIOWrapper) -> list[Issue]:
             if stripped := line.strip():
                 current.content += stripped + "\n"
 
-    return issues
+    if current is not None:
+        yield current
 
 
 Tag = Literal["unknown", "empty", "h1", "h2", "h3", "tdata", "tsep", "p", "li"]
 
 
+_TABLE_RE = re.compile(r"\|\s+(?:(?P<sep>-+\s+\|)|.*?\s+\|)")
+_MILESTONE_RE = re.compile(r"\d+\.\d+\.\d+")
+
+
+def cell_lookup(cells: dict) -> dict:
+    lookup = {}
+    for member, cell in cells.items():
+        lookup[member.value] = member
+        lookup[cell] = member
+        lookup[f" {cell} "] = member
+    return lookup
+
+
+_STATUSES = cell_lookup(STATUS_CELLS)
+_PRIORITIES = cell_lookup(PRIORITY_CELLS)
+_TYPES = cell_lookup(TYPE_CELLS)
+
+
 def parse_line(line: str) -> Tag:
-    if line.startswith("# "):
-        return "h1"
-    if line.startswith("## "):
-        return "h2"
-    if line.startswith("### "):
-        return "h3"
-    if re.match(r"\|\s+-+\s+\|", line):
-        return "tsep"
-    if re.match(r"\|\s+.*?\s+\|", line):
-        return "tdata"
-    if line.strip() == "":
+    if not line:
         return "empty"
-    if re.match(r"^\w+", line):
+    first = line[0]
+    if first == "#":
+        if line.startswith("# "):
+            return "h1"
+        if line.startswith("## "):
+            return "h2"
+        if line.startswith("### "):
+            return "h3"
+        return "unknown"
+    if first == "|":
+        match = _TABLE_RE.match(line)
+        if match is None:
+            return "unknown"
+        return "tsep" if match.group("sep") else "tdata"
+    if first.isspace():
+        return "empty" if line.isspace() else "unknown"
+    if first.isalnum() or first == "_":
         return "p"
-    if re.match(r"^- ", line):
+    if line.startswith("- "):
         return "li"
     return "unknown"
 
@@ -90,6 +171,10 @@ def parse_tdata(line: str) -> list[str]:
     return [item.strip() for item in line[1:-1].split("|")]
 
 
+def parse_tcells(line: str) -> list[str]:
+    return line[1:-1].split("|")
+
+
 def parse_tvalues(
     values: list[str],
 ) -> tuple[
@@ -104,7 +189,7 @@ def parse_tvalues(
         # Close date
         parse_date(values[3]),
         # Environment
-        values[4],
+        values[4].strip(),
         parse_priority(values[5]),
         parse_type(values[6]),
         parse_milestone(values[7]),
@@ -112,32 +197,24 @@ def parse_tvalues(
 
 
 def parse_status(status: str) -> StatusEnum:
-    return StatusEnum(status.strip())
+    return _STATUSES.get(status) or StatusEnum(status.strip())
 
 
 def parse_priority(status: str) -> PriorityEnum:
-    return PriorityEnum(status.strip())
+    return _PRIORITIES.get(status) or PriorityEnum(status.strip())
 
 
 def parse_type(status: str) -> TypeEnum:
-    return TypeEnum(status.strip())
+    return _TYPES.get(status) or TypeEnum(status.strip())
 
 
 def parse_milestone(milestone: str) -> str:
     _milestone = milestone.strip()
-    if re.match(r"\d+\.\d+\.\d+", _milestone):
+    if _MILESTONE_RE.match(_milestone):
         return _milestone
     return ""
 
 
-def parse_date(date_value: str) -> date | None:
-    parts = date_value.split("/")
-    if len(parts) != 3:
-        return None
-    return date(int(parts[2]), int(parts[1]), int(parts[0]))
-
-
 def dump_path(filepath: Path, issues: list[Issue]):
     with open(filepath, "w", encoding="utf8") as file:
-        for issue in issues:
-            print(str(issue), file=file, end="")
+        file.writelines(render_issue(issue) for issue in issues)
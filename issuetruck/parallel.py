@@ -0,0 +1,59 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, TextIOWrapper
+from pathlib import Path
+from typing import Optional
+
+from .cache import Record, decode_issue, encode_issue
+from .issue import Issue
+from .markdown import iter_issues
+from .reader import H1_BOUNDARY
+
+MIN_CHUNK_SIZE = 1 << 20
+
+
+def chunk_ranges(buffer: bytes | mmap.mmap, chunks: int) -> list[tuple[int, int]]:
+    size = len(buffer)
+    step = max(size // max(chunks, 1), MIN_CHUNK_SIZE)
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    while start < size:
+        boundary = buffer.find(H1_BOUNDARY, start + step - 1)
+        end = size if boundary == -1 else boundary + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def parse_range(filepath: Path, start: int, end: int) -> list[Record]:
+    with open(filepath, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return [
+        encode_issue(issue)
+        for issue in iter_issues(TextIOWrapper(BytesIO(data), encoding="utf8"))
+    ]
+
+
+def parse_path_parallel(filepath: Path, workers: Optional[int] = None) -> list[Issue]:
+    if not os.path.isfile(filepath) or os.path.getsize(filepath) == 0:
+        return []
+    workers = workers or os.cpu_count() or 1
+    with open(filepath, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            ranges = chunk_ranges(buffer, workers * 4)
+    if workers == 1 or len(ranges) == 1:
+        return [
+            decode_issue(x)
+            for start, end in ranges
+            for x in parse_range(filepath, start, end)
+        ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            parse_range,
+            [filepath] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+        )
+        return [decode_issue(record) for records in results for record in records]
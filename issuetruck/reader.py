@@ -0,0 +1,84 @@
+import mmap
+import os
+from io import BytesIO, TextIOWrapper
+from pathlib import Path
+from typing import Container, Iterator, Optional
+
+from .issue import Issue
+from .markdown import iter_issues
+
+H1 = b"# "
+H1_BOUNDARY = b"\n# "
+
+
+def iter_offsets(buffer: bytes | mmap.mmap) -> Iterator[tuple[int, int, int]]:
+    if buffer[: len(H1)] == H1:
+        start = 0
+    elif (start := buffer.find(H1_BOUNDARY)) == -1:
+        return
+    else:
+        start += 1
+    size = len(buffer)
+    while start < size:
+        end = buffer.find(H1_BOUNDARY, start)
+        end = size if end == -1 else end + 1
+        yield parse_offset_id(buffer, start), start, end - start
+        start = end
+
+
+def parse_offset_id(buffer: bytes | mmap.mmap, offset: int) -> int:
+    return int(buffer[offset + len(H1) : buffer.find(b"-", offset)])
+
+
+def build_offset_index(buffer: bytes | mmap.mmap) -> dict[int, tuple[int, int]]:
+    index: dict[int, tuple[int, int]] = {}
+    for issue_id, offset, length in iter_offsets(buffer):
+        index.setdefault(issue_id, (offset, length))
+    return index
+
+
+def parse_block(block: bytes) -> Optional[Issue]:
+    return next(iter_issues(TextIOWrapper(BytesIO(block), encoding="utf8")), None)
+
+
+def find_block(buffer: bytes | mmap.mmap, issue_id: int) -> Optional[tuple[int, int]]:
+    for current_id, offset, length in iter_offsets(buffer):
+        if current_id == issue_id:
+            return offset, length
+    return None
+
+
+def read_issue(filepath: Path, issue_id: int) -> Optional[Issue]:
+    if not os.path.isfile(filepath) or os.path.getsize(filepath) == 0:
+        return None
+    with open(filepath, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            found = find_block(buffer, issue_id)
+            if found is None:
+                return None
+            offset, length = found
+            return parse_block(buffer[offset : offset + length])
+
+
+def read_issues(filepath: Path, issue_ids: Container[int]) -> list[Issue]:
+    if not os.path.isfile(filepath) or os.path.getsize(filepath) == 0:
+        return []
+    issues: list[Issue] = []
+    seen: set[int] = set()
+    with open(filepath, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for issue_id, offset, length in iter_offsets(buffer):
+                if issue_id in issue_ids and issue_id not in seen:
+                    seen.add(issue_id)
+                    issue = parse_block(buffer[offset : offset + length])
+                    if issue is not None:
+                        issues.append(issue)
+    return issues
+
+
+def read_offset_index(filepath: Path) -> dict[int, tuple[int, int]]:
+    if not os.path.isfile(filepath) or os.path.getsize(filepath) == 0:
+        return {}
+    with open(filepath, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return build_offset_index(buffer)
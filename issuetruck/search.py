@@ -0,0 +1,123 @@
+import marshal
+import os
+import struct
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable
+
+from .cache import Signature, file_signature
+from .issue import Issue
+from .markdown import iter_path
+
+MAGIC = b"ITSRCH\x01"
+HEADER = struct.Struct(f"<{len(MAGIC)}sqQ16s")
+NO_SIGNATURE: Signature = (0, 0, bytes(16))
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[position : position + 3] for position in range(len(text) - 2)}
+
+
+def search_path(filepath: Path) -> Path:
+    return Path(filepath).with_name(f".{Path(filepath).name}.search")
+
+
+class SearchIndex:
+    def __init__(self) -> None:
+        self.documents: dict[int, tuple[str, str]] = {}
+        self.postings: dict[str, set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, issue: Issue) -> None:
+        document = (issue.title.lower(), issue.content.lower())
+        if self.documents.get(issue.id) == document:
+            return
+        self.remove(issue.id)
+        self.documents[issue.id] = document
+        for gram in trigrams(document[0]) | trigrams(document[1]):
+            self.postings[gram].add(issue.id)
+
+    def remove(self, issue_id: int) -> None:
+        document = self.documents.pop(issue_id, None)
+        if document is None:
+            return
+        for gram in trigrams(document[0]) | trigrams(document[1]):
+            ids = self.postings[gram]
+            ids.discard(issue_id)
+            if not ids:
+                del self.postings[gram]
+
+    def update(self, issues: Iterable[Issue]) -> None:
+        seen: set[int] = set()
+        for issue in issues:
+            if issue.id not in seen:
+                seen.add(issue.id)
+                self.add(issue)
+        for issue_id in self.documents.keys() - seen:
+            self.remove(issue_id)
+
+    def search(self, query: str, title: bool = True, content: bool = True) -> set[int]:
+        needle = query.lower()
+        grams = trigrams(needle)
+        if grams:
+            postings = sorted((self.postings.get(x, set()) for x in grams), key=len)
+            candidates: Iterable[int] = postings[0].intersection(*postings[1:])
+        else:
+            candidates = self.documents.keys()
+        documents = self.documents
+        return {
+            issue_id
+            for issue_id in candidates
+            if (title and needle in documents[issue_id][0])
+            or (content and needle in documents[issue_id][1])
+        }
+
+
+def read_search_index(filepath: Path) -> tuple[SearchIndex, Signature]:
+    index = SearchIndex()
+    try:
+        with open(search_path(filepath), "rb") as file:
+            magic, *signature = HEADER.unpack(file.read(HEADER.size))
+            if magic != MAGIC:
+                return index, NO_SIGNATURE
+            documents, postings = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError, struct.error):
+        return index, NO_SIGNATURE
+    index.documents = documents
+    index.postings.update((gram, set(ids)) for gram, ids in postings.items())
+    return index, (signature[0], signature[1], signature[2])
+
+
+def write_search_index(
+    filepath: Path, signature: Signature, index: SearchIndex
+) -> None:
+    target = search_path(filepath)
+    temporary = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "wb") as file:
+            file.write(HEADER.pack(MAGIC, *signature))
+            file.write(
+                marshal.dumps(
+                    (
+                        index.documents,
+                        {gram: list(ids) for gram, ids in index.postings.items()},
+                    )
+                )
+            )
+        os.replace(temporary, target)
+    except OSError:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+
+
+def load_search_index(filepath: Path) -> SearchIndex:
+    if not os.path.isfile(filepath):
+        return SearchIndex()
+    signature = file_signature(filepath)
+    index, stored_signature = read_search_index(filepath)
+    if stored_signature != signature:
+        index.update(iter_path(filepath))
+        write_search_index(filepath, signature, index)
+    return index
@@ -0,0 +1,205 @@
+import json
+import socketserver
+from contextlib import redirect_stdout
+from datetime import date
+from io import StringIO
+from pathlib import Path
+from typing import Any, Optional
+
+from .daemon import is_running, socket_path
+from .ids import allocate_id
+from .index import IssueIndex
+from .issue import (
+    Issue,
+    IssueList,
+    PriorityEnum,
+    StatusEnum,
+    TypeEnum,
+    change_issue_status,
+    create_issue,
+    edit_issue,
+    format_result,
+    paginate,
+    print_issues,
+)
+from .journal import append_journal, journal_enabled, journal_path, locked
+from .lock import Stat, file_lock, file_stat
+from .markdown import parse_path
+from .search import SearchIndex
+from .sort import SortEnum, sort_issues
+from .writer import splice_path
+
+StoreStat = tuple[Stat, Stat]
+
+
+def store_stat(filepath: Path) -> StoreStat:
+    return file_stat(filepath), file_stat(journal_path(filepath))
+
+
+def optional_enum(enum: Any, value: Optional[str]) -> Any:
+    return None if value is None else enum(value)
+
+
+class IssueStore:
+    def __init__(self, filepath: Path, jobs: int = 1) -> None:
+        self.filepath = filepath
+        self.jobs = jobs
+        self.stat: Optional[StoreStat] = None
+        self.issues = IssueList()
+        self._index: Optional[IssueIndex] = None
+        self._search: Optional[SearchIndex] = None
+        self.refresh()
+
+    def refresh(self) -> None:
+        stat = store_stat(self.filepath)
+        if self.stat is not None and stat == self.stat:
+            return
+        self.stat = stat
+        self.issues = parse_path(self.filepath, workers=self.jobs)
+        self._index = None
+        self._search = None
+
+    @property
+    def index(self) -> IssueIndex:
+        if self._index is None:
+            self._index = IssueIndex(self.issues)
+        return self._index
+
+    @property
+    def search_index(self) -> SearchIndex:
+        if self._search is None:
+            self._search = SearchIndex()
+            self._search.update(self.issues)
+        return self._search
+
+    def save(self, issues: list[Issue], new_issues: list[Issue] = ()) -> None:
+        if journal_enabled(self.filepath):
+            with locked(self.filepath) as journal:
+                append_journal(
+                    journal,
+                    [
+                        *(("create", issue) for issue in new_issues),
+                        *(("update", issue) for issue in issues),
+                    ],
+                )
+        else:
+            splice_path(self.filepath, issues, new_issues)
+        self.stat = store_stat(self.filepath)
+        self._index = None
+        if self._search is not None:
+            for issue in [*issues, *new_issues]:
+                self._search.add(issue)
+
+    def list(
+        self,
+        skip: Optional[int],
+        limit: Optional[int],
+        sort: Optional[str] = None,
+        reverse: bool = False,
+        **filters: Any,
+    ) -> None:
+        matches = self.index.apply_filters(**filters)
+        if sort is None:
+            issues = paginate(matches, skip=skip, limit=limit)
+            exhausted = limit is None or (skip or 0) + len(issues) >= len(matches)
+        else:
+            issues, _ = sort_issues(matches, SortEnum(sort), reverse, skip, limit)
+            exhausted = True
+        print(format_result(len(issues), len(self.issues), exhausted))
+        print("")
+        print_issues(issues)
+
+    def search(
+        self,
+        query: str,
+        title: bool = True,
+        content: bool = True,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> None:
+        issue_ids = self.search_index.search(query, title=title, content=content)
+        matches = [issue for issue in self.issues if issue.id in issue_ids]
+        issues = paginate(matches, skip=skip, limit=limit)
+        print(f"Search result {len(issues)}/{len(issue_ids)}")
+        print("")
+        print_issues(issues)
+
+    def create(self, title: str, start: int, **fields: Any) -> None:
+        new_issue = create_issue(
+            allocate_id(self.filepath, start),
+            title,
+            date.today(),
+            priority=optional_enum(PriorityEnum, fields.pop("priority")),
+            issue_type=TypeEnum(fields.pop("issue_type")),
+            **fields,
+        )
+        self.issues.insert(0, new_issue)
+        self.save([], [new_issue])
+        print("Created new issue")
+        print(f"{new_issue.id} - {new_issue.title}")
+
+    def edit(self, issue_id: int, **fields: Any) -> None:
+        issue = self.issues.get(issue_id)
+        if issue is None:
+            print(f"No issue found with id = {issue_id}")
+            return
+        edit_issue(
+            issue,
+            date.today(),
+            status=optional_enum(StatusEnum, fields.pop("status")),
+            priority=optional_enum(PriorityEnum, fields.pop("priority")),
+            issue_type=optional_enum(TypeEnum, fields.pop("issue_type")),
+            **fields,
+        )
+        self.save([issue])
+        print(f"Modified issue with id = {issue_id}")
+
+    def status(self, issue_id: int, **flags: Any) -> None:
+        issue = self.issues.get(issue_id)
+        if issue is None:
+            print(f"No issue found with id = {issue_id}")
+            return
+        change_issue_status(issue, date.today(), **flags)
+        self.save([issue])
+        print(f"Status set for issue with id = {issue_id}")
+
+    def handle(self, command: str, args: dict[str, Any]) -> str:
+        if command not in ("list", "search", "create", "edit", "status"):
+            raise ValueError(f"Unknown command {command!r}")
+        output = StringIO()
+        with file_lock(self.filepath, shared=command in ("list", "search")):
+            self.refresh()
+            try:
+                with redirect_stdout(output):
+                    getattr(self, command)(**args)
+            except Exception:
+                self.stat = None
+                raise
+        return output.getvalue()
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: "IssueServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            response = {"output": self.server.store.handle(**request)}
+        except Exception as error:
+            response = {"error": f"{type(error).__name__}: {error}"}
+        self.wfile.write(json.dumps(response).encode("utf8") + b"\n")
+
+
+class IssueServer(socketserver.UnixStreamServer):
+    def __init__(self, filepath: Path, jobs: int = 1) -> None:
+        self.store = IssueStore(filepath, jobs)
+        super().__init__(str(socket_path(filepath)), RequestHandler)
+
+
+def serve(filepath: Path, jobs: int = 1) -> IssueServer:
+    path = socket_path(filepath)
+    if is_running(filepath):
+        raise FileExistsError(f"A daemon is already serving {filepath} on {path}")
+    if path.exists():
+        path.unlink()
+    return IssueServer(filepath, jobs)
@@ -0,0 +1,89 @@
+import heapq
+import re
+from datetime import date
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar
+
+from .issue import Issue, PriorityEnum
+
+SortKey = tuple[int, ...]
+T = TypeVar("T")
+
+PRIORITY_RANKS = {priority: rank for rank, priority in enumerate(PriorityEnum)}
+_SEMVER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+
+class SortEnum(str, Enum):
+    ID = "id"
+    PRIORITY = "priority"
+    OPEN_DATE = "open_date"
+    CLOSE_DATE = "close_date"
+    MILESTONE = "milestone"
+
+
+@lru_cache(maxsize=1 << 12)
+def milestone_key(milestone: str) -> SortKey:
+    match = _SEMVER_RE.match(milestone)
+    if match is None:
+        return (1, 0, 0, 0)
+    return (0, *(int(x) for x in match.groups()))
+
+
+def date_key(value: Optional[date], sign: int = 1) -> SortKey:
+    return (1, 0) if value is None else (0, sign * value.toordinal())
+
+
+def sort_key(sort: SortEnum, reverse: bool = False) -> Callable[[Issue], SortKey]:
+    sign = -1 if reverse else 1
+    if sort == SortEnum.PRIORITY:
+        return lambda issue: (sign * PRIORITY_RANKS[issue.priority],)
+    if sort == SortEnum.OPEN_DATE:
+        return lambda issue: date_key(issue.open_date, sign)
+    if sort == SortEnum.CLOSE_DATE:
+        return lambda issue: date_key(issue.close_date, sign)
+    if sort == SortEnum.MILESTONE:
+
+        def key(issue: Issue) -> SortKey:
+            missing, *version = milestone_key(issue.milestone)
+            return (missing, *(sign * x for x in version))
+
+        return key
+    return lambda issue: (sign * issue.id,)
+
+
+class TopK(Generic[T]):
+    __slots__ = ("size", "heap", "count")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.heap: list[tuple[SortKey, int, Any]] = []
+        self.count = 0
+
+    def push(self, key: SortKey, item: T) -> None:
+        entry = (tuple(-x for x in key), -self.count, item)
+        self.count += 1
+        if len(self.heap) < self.size:
+            heapq.heappush(self.heap, entry)
+        elif self.heap and entry > self.heap[0]:
+            heapq.heapreplace(self.heap, entry)
+
+    def result(self) -> list[T]:
+        return [item for _, _, item in sorted(self.heap, reverse=True)]
+
+
+def sort_issues(
+    issues: Iterable[Issue],
+    sort: SortEnum,
+    reverse: bool = False,
+    skip: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> tuple[list[Issue], int]:
+    key = sort_key(sort, reverse)
+    if limit is None:
+        ordered = sorted(issues, key=key)
+        return ordered[skip or 0 :], len(ordered)
+    top: TopK[Issue] = TopK((skip or 0) + max(limit, 0))
+    for issue in issues:
+        top.push(key(issue), issue)
+    return top.result()[skip or 0 :], top.count
@@ -0,0 +1,117 @@
+import json
+import math
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from .issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+from .markdown import iter_path
+from .sort import milestone_key
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass(slots=True)
+class Durations:
+    count: int = 0
+    total: int = 0
+    histogram: dict[int, int] = field(default_factory=dict)
+
+    def add(self, start: Optional[date], end: Optional[date]) -> None:
+        if start is None or end is None:
+            return
+        days = (end - start).days
+        self.count += 1
+        self.total += days
+        self.histogram[days] = self.histogram.get(days, 0) + 1
+
+    def percentile(self, q: float) -> Optional[int]:
+        if not self.count:
+            return None
+        rank = max(math.ceil(q / 100 * self.count), 1)
+        seen = 0
+        for days in sorted(self.histogram):
+            seen += self.histogram[days]
+            if seen >= rank:
+                return days
+        return None
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2) if self.count else None,
+            "min": min(self.histogram, default=None),
+            "max": max(self.histogram, default=None),
+            **{f"p{q}": self.percentile(q) for q in PERCENTILES},
+        }
+
+
+@dataclass(slots=True)
+class Stats:
+    total: int = 0
+    status: dict[str, int] = field(default_factory=lambda: dict.fromkeys(StatusEnum, 0))
+    type: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TypeEnum, 0))
+    priority: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(PriorityEnum, 0)
+    )
+    milestone: dict[str, int] = field(default_factory=dict)
+    open_to_done: Durations = field(default_factory=Durations)
+    done_to_close: Durations = field(default_factory=Durations)
+
+    def add(self, issue: Issue) -> None:
+        self.total += 1
+        self.status[issue.status] += 1
+        self.type[issue.type] += 1
+        self.priority[issue.priority] += 1
+        self.milestone[issue.milestone] = self.milestone.get(issue.milestone, 0) + 1
+        self.open_to_done.add(issue.open_date, issue.done_date)
+        self.done_to_close.add(issue.done_date, issue.close_date)
+
+    def as_dict(self) -> dict[str, Any]:
+        counts = {
+            name: {str(key.value): value for key, value in getattr(self, name).items()}
+            for name in ("status", "type", "priority")
+        }
+        return {
+            "total": self.total,
+            **counts,
+            "milestone": dict(
+                sorted(self.milestone.items(), key=lambda x: milestone_key(x[0]))
+            ),
+            "open_to_done": self.open_to_done.summary(),
+            "done_to_close": self.done_to_close.summary(),
+        }
+
+
+def compute_stats(issues: Iterable[Issue]) -> Stats:
+    stats = Stats()
+    for issue in issues:
+        stats.add(issue)
+    return stats
+
+
+def stats_path(filepath: Path) -> Stats:
+    return compute_stats(iter_path(filepath, cache=False))
+
+
+def format_stats(stats: Stats) -> str:
+    data = stats.as_dict()
+    lines = [f"Issues {data['total']}"]
+    for name in ("status", "type", "priority", "milestone"):
+        lines.extend(["", name.capitalize()])
+        lines.extend(
+            f"{key or '(none)':<16} {value:>8}" for key, value in data[name].items()
+        )
+    for name in ("open_to_done", "done_to_close"):
+        summary = data[name]
+        lines.extend(["", f"{name.replace('_', ' ').capitalize()} (days)"])
+        lines.extend(
+            f"{key:<16} {'-' if value is None else value:>8}"
+            for key, value in summary.items()
+        )
+    return "\n".join(lines)
+
+
+def dump_stats(stats: Stats) -> str:
+    return json.dumps(stats.as_dict(), indent=2)
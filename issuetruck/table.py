@@ -0,0 +1,110 @@
+from array import array
+from sys import intern
+from typing import Iterable, Iterator, overload
+
+from .cache import PRIORITIES, STATUSES, TYPES
+from .dates import from_ordinal, to_ordinal
+from .issue import Issue
+
+
+class IssueTable:
+    __slots__ = (
+        "ids",
+        "titles",
+        "open_dates",
+        "statuses",
+        "types",
+        "priorities",
+        "subtitles",
+        "environments",
+        "milestones",
+        "done_dates",
+        "close_dates",
+        "contents",
+    )
+
+    def __init__(self, issues: Iterable[Issue] = ()) -> None:
+        self.ids = array("l")
+        self.titles: list[str] = []
+        self.open_dates = array("l")
+        self.statuses = array("b")
+        self.types = array("b")
+        self.priorities = array("b")
+        self.subtitles: list[str] = []
+        self.environments: list[str] = []
+        self.milestones: list[str] = []
+        self.done_dates = array("l")
+        self.close_dates = array("l")
+        self.contents: list[str] = []
+        self.extend(issues)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, position: int) -> Issue:
+        ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[Issue]:
+        ...
+
+    def __getitem__(self, position: int | slice) -> Issue | list[Issue]:
+        if isinstance(position, slice):
+            return [self.row(x) for x in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("IssueTable index out of range")
+        return self.row(position)
+
+    def __setitem__(self, position: int, issue: Issue) -> None:
+        self.ids[position] = issue.id
+        self.titles[position] = issue.title
+        self.open_dates[position] = to_ordinal(issue.open_date)
+        self.statuses[position] = STATUSES.index(issue.status)
+        self.types[position] = TYPES.index(issue.type)
+        self.priorities[position] = PRIORITIES.index(issue.priority)
+        self.subtitles[position] = issue.subtitle
+        self.environments[position] = issue.environment
+        self.milestones[position] = issue.milestone
+        self.done_dates[position] = to_ordinal(issue.done_date)
+        self.close_dates[position] = to_ordinal(issue.close_date)
+        self.contents[position] = issue.content
+
+    def __iter__(self) -> Iterator[Issue]:
+        return (self.row(position) for position in range(len(self)))
+
+    def row(self, position: int) -> Issue:
+        return Issue(
+            self.ids[position],
+            self.titles[position],
+            from_ordinal(self.open_dates[position]),
+            STATUSES[self.statuses[position]],
+            TYPES[self.types[position]],
+            PRIORITIES[self.priorities[position]],
+            self.subtitles[position],
+            self.environments[position],
+            self.milestones[position],
+            from_ordinal(self.done_dates[position]),
+            from_ordinal(self.close_dates[position]),
+            self.contents[position],
+        )
+
+    def append(self, issue: Issue) -> None:
+        self.ids.append(issue.id)
+        self.titles.append(issue.title)
+        self.open_dates.append(to_ordinal(issue.open_date))
+        self.statuses.append(STATUSES.index(issue.status))
+        self.types.append(TYPES.index(issue.type))
+        self.priorities.append(PRIORITIES.index(issue.priority))
+        self.subtitles.append(issue.subtitle)
+        self.environments.append(intern(issue.environment))
+        self.milestones.append(intern(issue.milestone))
+        self.done_dates.append(to_ordinal(issue.done_date))
+        self.close_dates.append(to_ordinal(issue.close_date))
+        self.contents.append(issue.content)
+
+    def extend(self, issues: Iterable[Issue]) -> None:
+        for issue in issues:
+            self.append(issue)
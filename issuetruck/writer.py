@@ -0,0 +1,116 @@
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from .ids import advance_high_water
+from .issue import Issue
+from .lock import Stat, check_stat, file_lock, file_stat, stat_key
+from .reader import iter_offsets
+
+CHUNK_SIZE = 1 << 20
+
+
+def encode_issue_block(issue: Issue) -> bytes:
+    return str(issue).encode("utf8")
+
+
+def copy_mode(target: Path, temporary: str) -> None:
+    if os.path.isfile(target):
+        shutil.copymode(target, temporary)
+        return
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(temporary, 0o666 & ~umask)
+
+
+def copy_range(
+    buffer: bytes | mmap.mmap, output: BinaryIO, start: int, end: int
+) -> None:
+    for offset in range(start, end, CHUNK_SIZE):
+        output.write(buffer[offset : min(offset + CHUNK_SIZE, end)])
+
+
+def splice_buffer(
+    buffer: bytes | mmap.mmap,
+    output: BinaryIO,
+    issues: Iterable[Issue] = (),
+    new_issues: Iterable[Issue] = (),
+) -> None:
+    changed = {}
+    for issue in issues:
+        changed.setdefault(issue.id, issue)
+    insert_at = len(buffer)
+    blocks: list[tuple[int, int, Issue]] = []
+    for issue_id, offset, length in iter_offsets(buffer):
+        insert_at = min(insert_at, offset)
+        if issue_id in changed:
+            blocks.append((offset, length, changed.pop(issue_id)))
+
+    position = 0
+    new_blocks = b"".join(encode_issue_block(issue) for issue in new_issues)
+    if new_blocks:
+        copy_range(buffer, output, position, insert_at)
+        if insert_at and buffer[insert_at - 1 : insert_at] != b"\n":
+            output.write(b"\n")
+        output.write(new_blocks)
+        position = insert_at
+    for offset, length, issue in blocks:
+        copy_range(buffer, output, position, offset)
+        output.write(encode_issue_block(issue))
+        position = offset + length
+    copy_range(buffer, output, position, len(buffer))
+
+
+@contextmanager
+def temporary_output(filepath: Path) -> Iterator[BinaryIO]:
+    directory = os.path.dirname(os.path.abspath(filepath))
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=directory, prefix=".", suffix=".tmp", delete=False
+    ) as output:
+        try:
+            yield output
+            copy_mode(filepath, output.name)
+            output.flush()
+            os.fsync(output.fileno())
+        except BaseException:
+            output.close()
+            os.unlink(output.name)
+            raise
+
+
+def splice_path(
+    filepath: Path,
+    issues: Iterable[Issue] = (),
+    new_issues: Iterable[Issue] = (),
+    expected: Optional[Stat] = None,
+) -> None:
+    new_issues = list(new_issues)
+    source = file_stat(filepath)
+    with temporary_output(filepath) as output:
+        if os.path.isfile(filepath) and os.path.getsize(filepath) > 0:
+            with open(filepath, "rb") as file:
+                source = stat_key(os.fstat(file.fileno()))
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    splice_buffer(buffer, output, issues, new_issues)
+        else:
+            splice_buffer(b"", output, issues, new_issues)
+    with file_lock(filepath):
+        try:
+            check_stat(filepath, expected)
+        except BaseException:
+            os.unlink(output.name)
+            raise
+        os.replace(output.name, filepath)
+        advance_high_water(filepath, source, (issue.id for issue in new_issues))
+
+
+def write_path(filepath: Path, issues: Iterable[Issue]) -> None:
+    with temporary_output(filepath) as output:
+        for issue in issues:
+            output.write(encode_issue_block(issue))
+    with file_lock(filepath):
+        os.replace(output.name, filepath)
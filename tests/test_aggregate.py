@@ -0,0 +1,75 @@
+from pathlib import Path
+
+from issuetruck.aggregate import aggregate, discover
+from issuetruck.issue import Issue, StatusEnum, apply_filters, paginate
+from issuetruck.markdown import dump_path, parse_path
+from issuetruck.sort import SortEnum
+
+
+def make_tree(root: Path) -> list[Path]:
+    paths = [
+        root / "a" / "ToDo.md",
+        root / "a" / "b" / "ToDo.md",
+        root / "c" / "ToDo.md",
+    ]
+    for number, path in enumerate(paths):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        dump_path(
+            path,
+            [
+                Issue(
+                    id=issue_id,
+                    title=f"Issue {number} {issue_id}",
+                    status=StatusEnum.OPEN if issue_id % 2 else StatusEnum.CLOSED,
+                )
+                for issue_id in range(5, 0, -1)
+            ],
+        )
+    (root / ".git").mkdir()
+    dump_path(root / ".git" / "ToDo.md", [Issue(id=1, title="Hidden")])
+    (root / "d").mkdir()
+    (root / "d" / "Other.md").write_text("")
+    return paths
+
+
+def test_discover(tmp_path: Path):
+    paths = make_tree(tmp_path)
+    assert list(discover(tmp_path)) == paths
+    assert list(discover(tmp_path, "Other.md")) == [tmp_path / "d" / "Other.md"]
+
+
+def test_aggregate(tmp_path: Path):
+    paths = make_tree(tmp_path)
+    merged = [(path, issue) for path in paths for issue in parse_path(path, False)]
+    for workers in (1, 2, 8):
+        for skip, limit, filters in (
+            (None, None, {}),
+            (None, None, {"is_open": True}),
+            (4, 3, {"is_open": True}),
+            (7, None, {"closed": True}),
+            (None, 0, {}),
+            (100, 1, {}),
+        ):
+            expected = paginate(
+                apply_filters([issue for _, issue in merged], **filters),
+                skip=skip,
+                limit=limit,
+            )
+            sources = aggregate(tmp_path, "ToDo.md", workers, skip, limit, **filters)
+            assert [issue for _, issue in sources] == expected
+    for skip, limit, reverse in ((None, None, False), (2, 4, True), (None, 0, False)):
+        sources = aggregate(
+            tmp_path, "ToDo.md", 2, skip, limit, SortEnum.ID, reverse, is_open=True
+        )
+        expected = sorted(
+            (source for source in merged if source[1].status == StatusEnum.OPEN),
+            key=lambda source: -source[1].id if reverse else source[1].id,
+        )
+        start = skip or 0
+        end = None if limit is None else start + limit
+        assert [issue.id for _, issue in sources] == [
+            issue.id for _, issue in expected[start:end]
+        ]
+    sources = aggregate(tmp_path, skip=5, limit=1)
+    assert sources[0][0] == paths[1]
+    assert sources[0][1].title == "Issue 1 5"
@@ -0,0 +1,68 @@
+import os
+import stat
+from datetime import date
+from pathlib import Path
+
+from issuetruck.archive import (
+    archive_path,
+    commit_archive,
+    discard_archive,
+    stage_archive,
+)
+from issuetruck.issue import Issue, StatusEnum, split_issues_to_archive
+from issuetruck.markdown import dump_path, parse_path
+
+ISSUES: list[Issue] = [
+    Issue(id=4, title="Fourth", status=StatusEnum.CLOSED),
+    Issue(id=3, title="Third", status=StatusEnum.CANCELED),
+    Issue(id=2, title="Second"),
+    Issue(id=1, title="First", status=StatusEnum.CLOSED),
+]
+
+
+def test_archive_path():
+    assert archive_path(date(2023, 2, 9)) == Path("ToDo-2023-02-09.md")
+
+
+def test_stage_archive(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    archive_filepath = tmp_path / "ToDo-2023-02-09.md"
+    dump_path(filepath, ISSUES)
+    archive_filepath.write_text("Archive preamble\n# 0 - Old\n", encoding="utf8")
+    staged = stage_archive(filepath, archive_filepath)
+    assert (staged.archived, staged.kept) == (2, 2)
+    commit_archive(staged, filepath, archive_filepath)
+    discard_archive(staged)
+    to_archive, to_keep = split_issues_to_archive(ISSUES)
+    assert parse_path(filepath, cache=False) == to_keep
+    assert archive_filepath.read_text(encoding="utf8") == (
+        "".join(str(issue) for issue in to_archive) + "Archive preamble\n# 0 - Old\n"
+    )
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_commit_archive_mode(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    archive_filepath = tmp_path / "ToDo-2023-02-09.md"
+    dump_path(filepath, ISSUES)
+    os.chmod(filepath, 0o640)
+    umask = os.umask(0o022)
+    try:
+        staged = stage_archive(filepath, archive_filepath)
+        commit_archive(staged, filepath, archive_filepath)
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(filepath).st_mode) == 0o640
+    assert stat.S_IMODE(os.stat(archive_filepath).st_mode) == 0o644
+
+
+def test_discard_archive(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    archive_filepath = tmp_path / "ToDo-2023-02-09.md"
+    dump_path(filepath, ISSUES[2:3])
+    staged = stage_archive(filepath, archive_filepath)
+    assert (staged.archived, staged.kept) == (0, 1)
+    discard_archive(staged)
+    assert not archive_filepath.exists()
+    assert parse_path(filepath, cache=False) == ISSUES[2:3]
+    assert not list(tmp_path.glob("*.tmp"))
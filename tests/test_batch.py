@@ -0,0 +1,80 @@
+from datetime import date
+from io import StringIO
+
+import pytest
+
+from issuetruck.batch import Batch, BatchFormatEnum, read_operations
+from issuetruck.issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+
+TODAY = date(2023, 3, 4)
+
+
+def test_read_operations_jsonl():
+    file = StringIO('{"op": "create", "title": "A"}\n\n{"op": "status", "id": 1}\n')
+    assert list(read_operations(file, BatchFormatEnum.JSONL)) == [
+        {"op": "create", "title": "A"},
+        {"op": "status", "id": 1},
+    ]
+
+
+def test_read_operations_not_object():
+    for record in ("[1, 2]", '"create"', "3", "null"):
+        file = StringIO(f'{{"op": "create", "title": "A"}}\n{record}\n')
+        operations = read_operations(file, BatchFormatEnum.JSONL)
+        assert next(operations) == {"op": "create", "title": "A"}
+        with pytest.raises(ValueError):
+            next(operations)
+
+
+def test_read_operations_csv():
+    file = StringIO("op,id,title,close\ncreate,,A,\nstatus,1,,yes\n")
+    assert list(read_operations(file, BatchFormatEnum.CSV)) == [
+        {"op": "create", "title": "A"},
+        {"op": "status", "id": "1", "close": "yes"},
+    ]
+
+
+def test_batch_run():
+    issues = [Issue(id=2, title="Second"), Issue(id=1, title="First")]
+    batch = Batch(issues, TODAY, start=1)
+    results = list(
+        batch.run(
+            [
+                {"op": "create", "title": "Third", "type": "Improvement"},
+                {"op": "create", "title": "Fourth", "priority": "High"},
+                {"op": "edit", "id": "1", "title": "Edited", "status": "Test"},
+                {"op": "status", "id": 2, "close": "true", "comment": "Done"},
+                {"op": "status", "id": 100},
+                {"op": "edit"},
+                {"op": "create"},
+                {"op": "create", "title": "X", "type": "Unknown"},
+                {"op": "delete", "id": 1},
+            ]
+        )
+    )
+    assert [error for _, _, _, error in results] == [
+        None,
+        None,
+        None,
+        None,
+        "No issue found with id = 100",
+        "Missing id",
+        "Missing title",
+        "'Unknown' is not a valid TypeEnum",
+        "Unknown operation 'delete'",
+    ]
+    assert [issue.id for issue in batch.issues] == [4, 3, 2, 1]
+    assert batch.issues[0].priority == PriorityEnum.HIGH
+    assert batch.issues[1].priority == PriorityEnum.LOW
+    assert batch.issues[1].type == TypeEnum.IMPROVEMENT
+    assert batch.issues[2].status == StatusEnum.CLOSED
+    assert batch.issues[2].close_date == TODAY
+    assert batch.issues[2].content == "04/03/2023 - status - Done\n\n"
+    assert batch.issues[3].title == "Edited"
+    assert batch.issues[3].done_date == TODAY
+
+
+def test_batch_start():
+    batch = Batch([], TODAY, start=10)
+    list(batch.run([{"op": "create", "title": "A"}, {"op": "create", "title": "B"}]))
+    assert [issue.id for issue in batch.issues] == [11, 10]
@@ -0,0 +1,79 @@
+import os
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+
+from issuetruck.cache import (
+    cache_path,
+    decode_issue,
+    encode_issue,
+    file_signature,
+    iter_cache,
+    write_cache,
+)
+from issuetruck.issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+from issuetruck.markdown import dump_path, iter_path, parse_path
+
+ISSUES: list[Issue] = [
+    Issue(
+        id=2,
+        title="Second",
+        subtitle="Subtitle",
+        status=StatusEnum.CLOSED,
+        type=TypeEnum.FEATURE,
+        priority=PriorityEnum.HIGH,
+        open_date=date(2023, 2, 9),
+        done_date=date(2023, 2, 10),
+        close_date=date(2023, 2, 11),
+        environment="FE",
+        milestone="1.2.3",
+        content="Comment\n",
+    ),
+    Issue(id=1, title="First", open_date=date(2023, 1, 1)),
+]
+
+
+def test_cache_path():
+    assert cache_path(Path("dir") / "ToDo.md") == Path("dir") / ".ToDo.md.idx"
+
+
+def test_encode_decode_issue():
+    for issue in ISSUES:
+        assert decode_issue(encode_issue(issue)) == issue
+
+
+def test_write_and_iter_cache(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, ISSUES)
+    signature = file_signature(filepath)
+    assert iter_cache(filepath, signature) is None
+    assert list(write_cache(filepath, signature, ISSUES)) == ISSUES
+    cached = iter_cache(filepath, signature)
+    assert cached is not None
+    assert list(cached) == ISSUES
+    assert iter_cache(filepath, (0, 0, b"\0" * 16)) is None
+
+
+def test_write_cache_interrupted(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, ISSUES)
+    issues = write_cache(filepath, file_signature(filepath), ISSUES)
+    next(issues)
+    issues.close()
+    assert list(tmp_path.iterdir()) == [filepath]
+
+
+def test_parse_path_uses_cache(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, ISSUES)
+    assert parse_path(filepath) == ISSUES
+    assert cache_path(filepath).is_file()
+    assert list(iter_path(filepath)) == ISSUES
+
+    stat = os.stat(filepath)
+    changed = [ISSUES[0], replace(ISSUES[1], title="Fir5t")]
+    dump_path(filepath, changed)
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(filepath).st_size == stat.st_size
+    assert parse_path(filepath) == changed
+    assert parse_path(filepath, cache=False) == changed
@@ -0,0 +1,21 @@
+from datetime import date
+
+from issuetruck.dates import format_date, from_ordinal, parse_date, to_ordinal
+
+
+def test_parse_date():
+    assert parse_date("09/02/2023") == date(2023, 2, 9)
+    assert parse_date("09/02/2023") is parse_date("09/02/2023")
+    assert parse_date("") is None
+
+
+def test_format_date():
+    assert format_date(date(2023, 2, 9)) == "09/02/2023"
+    assert format_date(date(1, 1, 1)) == "01/01/0001"
+    assert format_date(None) == ""
+
+
+def test_ordinal():
+    assert to_ordinal(None) == 0
+    assert from_ordinal(0) is None
+    assert from_ordinal(to_ordinal(date(2023, 2, 9))) == date(2023, 2, 9)
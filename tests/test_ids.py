@@ -0,0 +1,123 @@
+import multiprocessing
+from pathlib import Path
+
+from issuetruck import ids
+from issuetruck.ids import (
+    advance_high_water,
+    allocate_id,
+    high_water,
+    id_path,
+    read_high_water,
+    write_high_water,
+)
+from issuetruck.issue import Issue
+from issuetruck.lock import MISSING, file_stat
+from issuetruck.markdown import dump_path, parse_path
+from issuetruck.server import IssueStore
+from issuetruck.writer import splice_path
+
+CREATE = {
+    "title": "Created",
+    "priority": None,
+    "issue_type": "Bug",
+    "subtitle": "",
+    "environment": "",
+    "milestone": "",
+    "comment": "",
+    "start": 1,
+}
+ISSUES: list[Issue] = [Issue(id=7, title="Seventh"), Issue(id=3, title="Third")]
+
+
+def test_high_water(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    filepath = tmp_path / "ToDo.md"
+    assert read_high_water(filepath) is None
+    assert high_water(filepath) == 0
+    id_path(filepath).unlink()
+    dump_path(filepath, ISSUES)
+    dump_path(tmp_path / "ToDo-2023-02-09.md", [Issue(id=9, title="Ninth")])
+    assert high_water(filepath) == 9
+    assert read_high_water(filepath) == (9, file_stat(filepath))
+    write_high_water(filepath, 4)
+    assert high_water(filepath) == 4
+    id_path(filepath).write_text("broken")
+    assert high_water(filepath) == 9
+
+
+def test_allocate_id(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, ISSUES)
+    assert allocate_id(filepath) == 8
+    assert allocate_id(filepath) == 9
+    assert allocate_id(filepath, start=20) == 20
+    assert allocate_id(filepath, start=5) == 21
+    dump_path(filepath, [])
+    assert allocate_id(filepath) == 22
+    source = file_stat(filepath)
+    advance_high_water(filepath, source, [30])
+    advance_high_water(filepath, source, [25])
+    assert allocate_id(filepath) == 31
+    advance_high_water(filepath, MISSING, [40])
+    assert allocate_id(filepath) == 32
+
+
+def test_allocate_id_external_edit(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, [Issue(id=2, title="Second"), Issue(id=1, title="First")])
+    assert high_water(filepath) == 2
+    dump_path(
+        filepath,
+        [
+            Issue(id=3, title="FromTeammate"),
+            Issue(id=2, title="Second"),
+            Issue(id=1, title="First"),
+        ],
+    )
+    assert allocate_id(filepath) == 4
+    dump_path(filepath, [Issue(id=1, title="First")])
+    assert allocate_id(filepath) == 5
+
+
+def test_consecutive_creates_do_not_rescan(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    filepath = tmp_path / "ToDo.md"
+    scans = []
+    scan_high_water = ids.scan_high_water
+
+    def counted(filepath: Path) -> int:
+        scans.append(filepath)
+        return scan_high_water(filepath)
+
+    monkeypatch.setattr(ids, "scan_high_water", counted)
+    for number in range(1, 5):
+        issue_id = allocate_id(filepath)
+        splice_path(filepath, new_issues=[Issue(id=issue_id, title=f"Issue {number}")])
+        assert issue_id == number
+    store = IssueStore(filepath)
+    for _ in range(2):
+        store.handle("create", CREATE)
+    assert len(scans) == 1
+    assert [issue.id for issue in parse_path(filepath)] == [6, 5, 4, 3, 2, 1]
+
+
+def allocate_many(filepath: Path, count: int, queue) -> None:
+    queue.put([allocate_id(filepath) for _ in range(count)])
+
+
+def test_concurrent_allocate_id(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    filepath = tmp_path / "ToDo.md"
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=allocate_many, args=(filepath, 25, queue))
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    ids = [issue_id for _ in processes for issue_id in queue.get()]
+    for process in processes:
+        process.join()
+    assert sorted(ids) == list(range(1, 101))
@@ -0,0 +1,57 @@
+from issuetruck.index import IssueIndex
+from issuetruck.issue import apply_filters
+
+from .test_issue import ISSUES
+
+CRITERIA: list[dict] = [
+    {},
+    {"is_open": True},
+    {"is_open": True, "closed": True},
+    {"closed": True},
+    {"test": True},
+    {"canceled": True},
+    {"bug": True},
+    {"feature": True},
+    {"improvement": True},
+    {"experimental": True},
+    {"memo": True},
+    {"low": True},
+    {"medium": True},
+    {"high": True},
+    {"critical": True},
+    {"medium": True, "is_open": True},
+    {"environment": "DEV"},
+    {"environment": "XYZ"},
+    {"environment": ""},
+    {"milestone": "1."},
+    {"milestone": "1.2."},
+    {"milestone": "1.2.3"},
+    {"milestone": "2."},
+    {"milestone": "9"},
+    {"milestone": ""},
+    {"closed": True, "milestone": "1."},
+    {"medium": True, "milestone": "3"},
+    {"is_open": True, "environment": "PROD", "milestone": "3."},
+    {"title": "DEF"},
+    {"title": "ghi", "milestone": "1.2"},
+    {"title": "XYZ"},
+]
+
+
+def test_issue_index():
+    index = IssueIndex(ISSUES)
+    for criteria in CRITERIA:
+        assert index.apply_filters(**criteria) == apply_filters(ISSUES, **criteria)
+
+
+def test_issue_index_empty():
+    index = IssueIndex([])
+    for criteria in CRITERIA:
+        assert index.apply_filters(**criteria) == []
+
+
+def test_milestone_prefix():
+    index = IssueIndex(ISSUES)
+    assert index.milestone_prefix("1.") == [0, 1, 2]
+    assert index.milestone_prefix("1.2.3") == [2]
+    assert index.milestone_prefix("4") == []
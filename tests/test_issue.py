@@ -2,11 +2,18 @@ import re
 from datetime import date
 
 from issuetruck.issue import (
+    MD_THEAD,
+    MD_TSEP,
     Issue,
+    IssueList,
     PriorityEnum,
     StatusEnum,
     TypeEnum,
     apply_filters,
+    change_issue_status,
+    compile_filters,
+    create_issue,
+    edit_issue,
     filter_by_environment,
     filter_by_milestone,
     filter_by_priority_critical,
@@ -23,12 +30,16 @@ from issuetruck.issue import (
     filter_by_type_feature,
     filter_by_type_improvement,
     filter_by_type_memo,
+    filter_issues,
     format_comment,
+    format_date,
     get_by_id,
     get_new_id,
     get_new_priority,
+    iter_paginate,
     paginate,
     print_issues,
+    render_issue,
     split_issues_to_archive,
 )
 
@@ -248,6 +259,24 @@ def test_apply_filters():
     assert len(apply_filters(ISSUES, title=None)) == len(ISSUES)
 
 
+def test_compile_filters():
+    assert compile_filters() is None
+    assert compile_filters(environment="", milestone="", title="") is None
+
+    stream = compile_filters(is_open=True, closed=True)
+    assert stream is not None
+    assert list(stream(ISSUES)) == []
+
+    stream = compile_filters(is_open=True, medium=True, environment="PROD")
+    assert stream is not None
+    assert [issue.id for issue in stream(ISSUES)] == [5]
+    assert [issue.id for issue in stream(iter(ISSUES))] == [5]
+
+    stream = compile_filters(milestone="1.", title="def")
+    assert stream is not None
+    assert [issue.id for issue in stream(ISSUES)] == [1, 3]
+
+
 def test_get_new_id():
     assert get_new_id(ISSUES) == 6
     assert get_new_id(ISSUES, 3) == 6
@@ -329,6 +358,42 @@ def test_format_comment():
     )
 
 
+def test_create_issue():
+    issue = create_issue(
+        7, "Title", date(2023, 3, 4), issue_type=TypeEnum.IMPROVEMENT, comment="Hi"
+    )
+    assert issue.id == 7
+    assert issue.status == StatusEnum.OPEN
+    assert issue.priority == PriorityEnum.LOW
+    assert issue.open_date == date(2023, 3, 4)
+    assert issue.content == "04/03/2023 - create - Hi\n\n"
+    assert create_issue(1, "Title", date(2023, 3, 4)).content == ""
+
+
+def test_edit_issue():
+    issue = Issue(id=1, title="Title")
+    edit_issue(issue, date(2023, 3, 4), status=StatusEnum.TEST, milestone="1.0.0")
+    assert issue.status == StatusEnum.TEST
+    assert issue.done_date == date(2023, 3, 4)
+    assert issue.milestone == "1.0.0"
+    edit_issue(issue, date(2023, 3, 5), status=StatusEnum.OPEN, comment="Reopen")
+    assert issue.done_date is None
+    assert issue.content == "05/03/2023 - edit - Reopen\n\n"
+
+
+def test_change_issue_status():
+    issue = Issue(id=1, title="Title")
+    change_issue_status(issue, date(2023, 3, 4), close=True)
+    assert issue.status == StatusEnum.CLOSED
+    assert issue.close_date == date(2023, 3, 4)
+    change_issue_status(issue, date(2023, 3, 5), close=True)
+    assert issue.close_date == date(2023, 3, 4)
+    change_issue_status(issue, date(2023, 3, 6), is_open=True, comment="Again")
+    assert issue.status == StatusEnum.OPEN
+    assert issue.close_date is None
+    assert issue.content == "06/03/2023 - status - Again\n\n"
+
+
 def test_paginate():
     assert len(paginate([])) == 0
     assert len(paginate([], skip=2)) == 0
@@ -340,6 +405,35 @@ def test_paginate():
     assert len(paginate(ISSUES, skip=2, limit=3)) == 3
 
 
+def test_filter_issues():
+    assert list(filter_issues([])) == []
+    assert list(filter_issues(ISSUES)) == ISSUES
+    assert list(filter_issues(iter(ISSUES), is_open=True)) == apply_filters(
+        ISSUES, is_open=True
+    )
+    assert [issue.id for issue in filter_issues(ISSUES, title="ghi")] == [2, 3]
+
+
+def test_iter_paginate():
+    assert len(list(iter_paginate([]))) == 0
+    assert len(list(iter_paginate(ISSUES))) == len(ISSUES)
+    assert len(list(iter_paginate(ISSUES, skip=2))) == len(ISSUES) - 2
+    assert len(list(iter_paginate(ISSUES, limit=3))) == 3
+    assert [issue.id for issue in iter_paginate(ISSUES, skip=2, limit=2)] == [3, 4]
+    assert len(list(iter_paginate(ISSUES, skip=-1))) == len(ISSUES)
+    assert len(list(iter_paginate(ISSUES, limit=-1))) == 0
+
+    consumed = []
+
+    def source():
+        for issue in ISSUES:
+            consumed.append(issue.id)
+            yield issue
+
+    assert [issue.id for issue in iter_paginate(source(), skip=1, limit=1)] == [2]
+    assert consumed == [1, 2]
+
+
 ISSUES: list[Issue] = [
     Issue(
         id=1,
@@ -438,3 +532,50 @@ ISSUES_TO_KEEP: list[Issue] = [
         milestone="1.2.3",
     ),
 ]
+
+
+def test_render_issue():
+    issue = Issue(id=1, title="Title", open_date=date(2023, 2, 9))
+    text = render_issue(issue)
+    assert text == str(issue)
+    assert render_issue(issue) is text
+    assert MD_THEAD in text and MD_TSEP in text
+    assert "| 09/02/2023 |" in text
+    issue.title = "Other"
+    assert render_issue(issue).startswith("# 1 - Other\n")
+    issue.content = "Comment\n"
+    assert render_issue(issue).endswith("|\n\nComment\n")
+    assert issue == Issue(
+        id=1, title="Other", open_date=date(2023, 2, 9), content="Comment\n"
+    )
+
+
+def test_format_date():
+    assert format_date(None) == ""
+    assert format_date(date(2023, 2, 9)) == "09/02/2023"
+    assert format_date(date(2023, 2, 9)) is format_date(date(2023, 2, 9))
+
+
+def test_issue_list():
+    issues = IssueList([Issue(id=2, title="Second"), Issue(id=1, title="First")])
+    assert issues == [Issue(id=2, title="Second"), Issue(id=1, title="First")]
+    assert issues.get(1) is issues[1]
+    assert get_by_id(issues, 2) is issues[0]
+    assert issues.get(3) is None
+    issues.insert(0, Issue(id=3, title="Third"))
+    assert issues.get(3) is issues[0]
+    duplicate = Issue(id=1, title="Duplicate")
+    issues.insert(0, duplicate)
+    assert issues.get(1) is duplicate
+    issues.remove(duplicate)
+    assert issues.get(1).title == "First"
+    issues.append(Issue(id=4, title="Fourth"))
+    issues += [Issue(id=5, title="Fifth")]
+    assert [issues.get(x).id for x in (4, 5)] == [4, 5]
+    del issues[-1]
+    assert issues.get(5) is None
+    issues[0] = Issue(id=6, title="Sixth")
+    assert issues.get(3) is None and issues.get(6) is issues[0]
+    assert issues.pop(0).id == 6 and issues.get(6) is None
+    issues.clear()
+    assert issues.get(1) is None
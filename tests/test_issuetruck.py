@@ -1,5 +1,37 @@
+import subprocess
+import sys
+from pathlib import Path
+
 from issuetruck import __version__
 
 
 def test_version():
     assert __version__ == "1.8.0"
+
+
+def run_main(*args: str, plain: bool = False) -> str:
+    code = (
+        "import atexit, sys\n"
+        "atexit.register(lambda: print(sorted(m for m in ('typer', 'rich')"
+        " if sys.modules.get(m))))\n"
+        "from issuetruck.__main__ import main\n"
+        f"sys.argv = ['main', *{list(args)!r}]\n"
+        "main()\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"ISSUETRUCK_PLAIN": "1"} if plain else {},
+        cwd=Path(__file__).parent.parent,
+    )
+    return result.stdout.splitlines()[-1]
+
+
+def test_version_fast_path():
+    assert run_main("--version") == "[]"
+
+
+def test_plain_output(tmp_path):
+    args = ("list", "--filepath", str(tmp_path / "ToDo.md"))
+    assert run_main(*args, plain=True) == "['typer']"
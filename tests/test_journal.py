@@ -0,0 +1,115 @@
+import os
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+from issuetruck.issue import Issue, StatusEnum
+from issuetruck.journal import (
+    JOURNAL_ENV,
+    append_journal,
+    apply_journal,
+    compact,
+    fold_journal,
+    journal_enabled,
+    journal_ids,
+    journal_issue,
+    journal_path,
+    locked,
+    read_journal,
+)
+from issuetruck.markdown import dump_path, parse_path
+
+ISSUES: list[Issue] = [
+    Issue(id=2, title="Second", open_date=date(2023, 1, 2)),
+    Issue(id=1, title="First", open_date=date(2023, 1, 1)),
+]
+
+
+def write_journal(filepath: Path, *entries) -> None:
+    with locked(filepath) as journal:
+        append_journal(journal, entries)
+
+
+def test_read_journal(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    assert journal_path(filepath) == tmp_path / "ToDo.md.journal"
+    assert read_journal(filepath) == []
+    assert not journal_enabled(filepath)
+    issue = Issue(id=3, title="Third", open_date=date(2023, 1, 3), content="x\n")
+    write_journal(filepath, ("create", issue))
+    assert journal_enabled(filepath)
+    with open(journal_path(filepath), "ab") as file:
+        file.write(b'["update", 3')
+    assert read_journal(filepath) == [("create", issue)]
+
+
+def test_journal_enabled(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(JOURNAL_ENV, "1")
+    assert journal_enabled(tmp_path / "ToDo.md")
+
+
+def test_read_without_journal(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(JOURNAL_ENV, "1")
+    filepath = tmp_path / "ToDo-2023-01-01.md"
+    dump_path(filepath, ISSUES)
+    assert parse_path(filepath, cache=False) == ISSUES
+    assert parse_path(filepath, cache=False, workers=2) == ISSUES
+    assert sorted(path.name for path in tmp_path.iterdir()) == [filepath.name]
+
+
+def test_fold_journal():
+    first = Issue(id=3, title="Third")
+    second = Issue(id=4, title="Fourth")
+    edited = Issue(id=3, title="Third", status=StatusEnum.CLOSED)
+    update = Issue(id=1, title="Changed")
+    entries = [
+        ("create", first),
+        ("create", second),
+        ("update", edited),
+        ("update", update),
+    ]
+    assert fold_journal(entries) == ([second, edited], {1: update})
+    assert list(apply_journal(ISSUES, entries)) == [second, edited, ISSUES[0], update]
+
+
+def test_parse_path_with_journal(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, ISSUES)
+    created = Issue(id=3, title="Third")
+    updated = Issue(id=1, title="First", status=StatusEnum.TEST)
+    write_journal(filepath, ("create", created), ("update", updated))
+    expected = [created, ISSUES[0], updated]
+    assert parse_path(filepath) == expected
+    assert parse_path(filepath, workers=2) == expected
+    assert journal_issue(filepath, 1) == updated
+    assert journal_issue(filepath, 2) == ISSUES[0]
+    assert journal_issue(filepath, 9) is None
+    assert set(journal_ids(filepath)) == {1, 2, 3}
+
+    assert compact(filepath) == 2
+    assert os.path.getsize(journal_path(filepath)) == 0
+    assert not journal_enabled(filepath)
+    assert parse_path(filepath) == expected
+    assert compact(filepath) == 0
+
+
+def test_concurrent_creates(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, ISSUES)
+    env = {**os.environ, JOURNAL_ENV: "1", "ISSUETRUCK_NO_DAEMON": "1"}
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-m", "issuetruck", "create", f"Issue {n}"]
+            + ["--filepath", str(filepath)],
+            env=env,
+            cwd=Path(__file__).parent.parent,
+            stdout=subprocess.DEVNULL,
+        )
+        for n in range(6)
+    ]
+    assert all(process.wait() == 0 for process in processes)
+    ids = [issue.id for issue in parse_path(filepath)]
+    assert sorted(ids) == list(range(1, 9))
+    compact(filepath)
+    assert sorted(issue.id for issue in parse_path(filepath)) == list(range(1, 9))
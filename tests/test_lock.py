@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.bench_concurrency import run_stress
+from benchmarks.synthetic import write_todo
+from issuetruck.issue import Issue
+from issuetruck.lock import (
+    MISSING,
+    ConflictError,
+    check_stat,
+    file_lock,
+    file_stat,
+    lock_path,
+    read_modify_write,
+)
+from issuetruck.markdown import parse_path
+from issuetruck.writer import splice_path
+
+
+def test_file_stat(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    assert file_stat(filepath) == MISSING
+    check_stat(filepath, MISSING)
+    check_stat(filepath, None)
+    filepath.write_text("# 1 - First\n")
+    with pytest.raises(ConflictError):
+        check_stat(filepath, MISSING)
+
+
+def test_file_lock(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    with file_lock(filepath, shared=True):
+        assert not lock_path(filepath).exists()
+    with file_lock(filepath):
+        with file_lock(filepath, shared=True):
+            assert lock_path(filepath).exists()
+
+
+def test_splice_path_conflict(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    splice_path(filepath, new_issues=[Issue(id=1, title="First")])
+    expected = file_stat(filepath)
+    splice_path(filepath, new_issues=[Issue(id=2, title="Second")])
+    with pytest.raises(ConflictError):
+        splice_path(
+            filepath, new_issues=[Issue(id=3, title="Third")], expected=expected
+        )
+    assert [issue.id for issue in parse_path(filepath, cache=False)] == [2, 1]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_read_modify_write(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    attempts = []
+
+    def operation(expected):
+        attempts.append(expected)
+        if len(attempts) < 3:
+            raise ConflictError()
+        return len(attempts)
+
+    assert read_modify_write(filepath, operation, optimistic=True) == 3
+    assert attempts == [MISSING, MISSING, MISSING]
+    assert read_modify_write(filepath, lambda expected: expected) is None
+
+
+@pytest.mark.parametrize("optimistic", [False, True])
+def test_no_lost_updates(tmp_path: Path, optimistic: bool):
+    filepath = write_todo(tmp_path / "ToDo.md", 50)
+    applied, _ = run_stress(filepath, 4, 10, optimistic)
+    assert applied == 40
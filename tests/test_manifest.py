@@ -0,0 +1,118 @@
+import os
+import stat
+from datetime import date
+from pathlib import Path
+
+from issuetruck.issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+from issuetruck.manifest import (
+    ArchiveSummary,
+    archive_signature,
+    load_manifest,
+    read_manifest,
+    record_archive,
+    select_archives,
+    manifest_path,
+    summarize,
+    write_manifest,
+)
+from issuetruck.markdown import dump_path
+
+FIRST: list[Issue] = [
+    Issue(
+        id=2,
+        title="Second",
+        open_date=date(2023, 1, 2),
+        close_date=date(2023, 2, 1),
+        status=StatusEnum.CLOSED,
+        environment="BE",
+        milestone="1.2.0",
+    ),
+    Issue(id=1, title="First", open_date=date(2023, 1, 1), status=StatusEnum.CANCELED),
+]
+SECOND: list[Issue] = [
+    Issue(
+        id=5,
+        title="Fifth",
+        open_date=date(2023, 3, 1),
+        status=StatusEnum.CLOSED,
+        type=TypeEnum.FEATURE,
+        priority=PriorityEnum.HIGH,
+    ),
+]
+
+
+def test_archive_summary():
+    summary = ArchiveSummary()
+    for issue in FIRST:
+        summary.add(issue)
+    assert (summary.count, summary.min_id, summary.max_id) == (2, 1, 2)
+    assert summary.statuses == {"Closed": 1, "Canceled": 1}
+    assert summary.environments == ["BE", ""]
+    assert (summary.first_open, summary.last_open) == ("2023-01-01", "2023-01-02")
+    assert summary.last_close == "2023-02-01"
+    assert summary.may_match(closed=True, environment="BE", milestone="1.2")
+    assert not summary.may_match(is_open=True)
+    assert not summary.may_match(feature=True)
+    assert not summary.may_match(environment="FE")
+    assert not summary.may_match(milestone="2.")
+    assert not ArchiveSummary().may_match()
+
+    other = ArchiveSummary()
+    other.add(SECOND[0])
+    summary.merge(other)
+    assert (summary.count, summary.min_id, summary.max_id) == (3, 1, 5)
+    assert summary.statuses == {"Closed": 2, "Canceled": 1}
+    assert summary.last_open == "2023-03-01"
+    assert summary.may_match(feature=True, high=True)
+
+
+def test_load_manifest(tmp_path: Path):
+    dump_path(tmp_path / "ToDo-2023-02-01.md", FIRST)
+    dump_path(tmp_path / "ToDo-2023-03-01.md", SECOND)
+    dump_path(tmp_path / "ToDo.md", [])
+    manifest = load_manifest(tmp_path)
+    assert sorted(manifest) == ["ToDo-2023-02-01.md", "ToDo-2023-03-01.md"]
+    assert read_manifest(tmp_path) == manifest
+    assert manifest["ToDo-2023-03-01.md"] == summarize(tmp_path / "ToDo-2023-03-01.md")
+
+    assert select_archives(tmp_path) == [
+        tmp_path / "ToDo-2023-03-01.md",
+        tmp_path / "ToDo-2023-02-01.md",
+    ]
+    assert select_archives(tmp_path, canceled=True) == [tmp_path / "ToDo-2023-02-01.md"]
+    assert select_archives(tmp_path, is_open=True) == []
+
+    (tmp_path / "ToDo-2023-02-01.md").unlink()
+    assert sorted(load_manifest(tmp_path)) == ["ToDo-2023-03-01.md"]
+
+
+def test_write_manifest_mode(tmp_path: Path):
+    umask = os.umask(0o022)
+    try:
+        write_manifest(tmp_path, {})
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(manifest_path(tmp_path)).st_mode) == 0o644
+
+
+def test_record_archive(tmp_path: Path):
+    filepath = tmp_path / "ToDo-2023-03-01.md"
+    archived = ArchiveSummary()
+    archived.add(SECOND[0])
+    dump_path(filepath, SECOND)
+    record_archive(filepath, archived, None)
+    assert read_manifest(tmp_path)[filepath.name] == summarize(filepath)
+
+    previous = archive_signature(filepath)
+    archived = ArchiveSummary()
+    for issue in FIRST:
+        archived.add(issue)
+    dump_path(filepath, FIRST + SECOND)
+    record_archive(filepath, archived, previous)
+    recorded = read_manifest(tmp_path)[filepath.name]
+    assert recorded.count == 3
+    assert recorded.signature == archive_signature(filepath)
+
+    record_archive(filepath, archived, (0, 0))
+    assert filepath.name not in read_manifest(tmp_path)
+    assert load_manifest(tmp_path)[filepath.name].count == 3
@@ -1,5 +1,7 @@
 from io import BytesIO, TextIOWrapper
 
+import pytest
+
 from issuetruck.issue import PriorityEnum, StatusEnum, TypeEnum
 from issuetruck.markdown import (
     parse_date,
@@ -7,10 +9,12 @@ from issuetruck.markdown import (
     parse_h1,
     parse_h2,
     parse_h3,
+    iter_issues,
     parse_line,
     parse_milestone,
     parse_priority,
     parse_status,
+    parse_tcells,
     parse_tdata,
     parse_tvalues,
     parse_type,
@@ -47,6 +51,15 @@ def test_parse_line():
     assert parse_line("ABC") == "p"
     assert parse_line("123") == "p"
     assert parse_line("- [ ] List item") == "li"
+    assert parse_line("#Title") == "unknown"
+    assert parse_line("#### Title") == "unknown"
+    assert parse_line("|| Data |") == "unknown"
+    assert parse_line("| -- | -- |") == "tsep"
+    assert parse_line("| - Data | - |") == "tdata"
+    assert parse_line("  Indented") == "unknown"
+    assert parse_line("_Underscore") == "p"
+    assert parse_line("-No space") == "unknown"
+    assert parse_line("* Star") == "unknown"
 
 
 def test_parse_status():
@@ -124,6 +137,31 @@ def test_parse_date():
     assert parsed.year == 1987
 
 
+def test_parse_padded_cells():
+    assert parse_status(" Open     ") == StatusEnum.OPEN
+    assert parse_status("Canceled") == StatusEnum.CANCELED
+    assert parse_status("  Test ") == StatusEnum.TEST
+    assert parse_priority(" Critical ") == PriorityEnum.CRITICAL
+    assert parse_type(" Improvement  ") == TypeEnum.IMPROVEMENT
+    assert parse_type(" Memo         ") == TypeEnum.MEMO
+    with pytest.raises(ValueError):
+        parse_status(" Unknown  ")
+
+
+def test_parse_tcells():
+    cells = parse_tcells("| Open     | 01/02/1987 |            | FE |\n")
+    assert cells[0] == " Open     "
+    parsed = parse_tvalues(
+        parse_tcells(
+            "| Open     | 01/02/1987 |            |            | FE          "
+            "| Medium   | Bug          | 1.2.3       |\n"
+        )
+    )
+    assert parsed == parse_tvalues(
+        ["Open", "01/02/1987", "", "", "FE", "Medium", "Bug", "1.2.3"]
+    )
+
+
 def test_parse_tvalues():
     parsed = parse_tvalues(
         ["Open", "01/02/1987", "", "", "FE", "Medium", "Bug", "1.2.3"]
@@ -179,3 +217,21 @@ def test_parse_file():
     assert issue.close_date.day == 11
     assert issue.close_date.month == 2
     assert issue.close_date.year == 2023
+
+
+def test_iter_issues():
+    def lines():
+        yield "# 2 - Second\n"
+        yield "| Status | Open date | Done date | Close date | Environment | Priority | Type | Milestone |\n"
+        yield "| ------ | --------- | --------- | ---------- | ----------- | -------- | ---- | --------- |\n"
+        yield "| Open   | 09/02/2023 |          |            | FE          | Medium   | Bug  |           |\n"
+        yield "Content\n"
+        yield "# 1 - First\n"
+        raise AssertionError("read past the second heading")
+
+    issues = iter_issues(lines())
+    issue = next(issues)
+    assert issue.id == 2
+    assert issue.title == "Second"
+    assert issue.content == "Content\n"
+    assert list(iter_issues([])) == []
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from issuetruck import parallel
+from issuetruck.markdown import parse_path
+from issuetruck.parallel import chunk_ranges, parse_path_parallel
+
+from benchmarks.synthetic import write_todo
+
+
+def test_chunk_ranges(monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 1)
+    buffer = b"Preamble\n# 1 - A\nText\n# 2 - B\n# 3 - C\n"
+    ranges = chunk_ranges(buffer, 3)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(buffer)
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert all(buffer[start:].startswith(b"# ") for start, _ in ranges[1:])
+    assert len(ranges) > 1
+    assert chunk_ranges(b"", 4) == []
+    assert chunk_ranges(b"# 1 - A\n", 4) == [(0, 8)]
+
+
+def test_parse_path_parallel(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 4096)
+    filepath = write_todo(tmp_path / "ToDo.md", 200)
+    expected = parse_path(filepath, cache=False)
+    assert len(parallel.chunk_ranges(filepath.read_bytes(), 8)) > 1
+    assert parse_path_parallel(filepath, 1) == expected
+    assert parse_path_parallel(filepath, 2) == expected
+    assert parse_path(filepath, workers=2) == expected
+    assert parse_path(filepath, workers=2) == expected
+    assert parse_path_parallel(tmp_path / "Missing.md") == []
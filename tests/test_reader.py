@@ -0,0 +1,98 @@
+from pathlib import Path
+
+from issuetruck.issue import Issue, StatusEnum
+from issuetruck.markdown import dump_path, parse_path
+from issuetruck.reader import (
+    build_offset_index,
+    find_block,
+    iter_offsets,
+    parse_block,
+    read_issue,
+    read_issues,
+    read_offset_index,
+)
+
+CONTENT = (
+    b"Preamble\n"
+    + b"# 3 - Third\n"
+    + b"\n"
+    + b"| Status   | Open date  | Done date  | Close date | Environment | Priority | Type         | Milestone   |\n"
+    + b"| -------- | ---------- | ---------- | ---------- | ----------- | -------- | ------------ | ----------- |\n"
+    + b"| Closed   | 09/02/2023 |            | 11/02/2023 | FE          | Medium   | Feature      | 2.3.4       |\n"
+    + b"\n"
+    + b"Some # content\n"
+    + b"\n"
+    + b"# 1 - First\n"
+    + b"\n"
+    + b"| Status   | Open date  | Done date  | Close date | Environment | Priority | Type         | Milestone   |\n"
+    + b"| -------- | ---------- | ---------- | ---------- | ----------- | -------- | ------------ | ----------- |\n"
+    + b"| Open     | 09/02/2023 |            |            | BE          | High     | Bug          |             |\n"
+)
+
+
+def test_iter_offsets():
+    offsets = list(iter_offsets(CONTENT))
+    assert [issue_id for issue_id, _, _ in offsets] == [3, 1]
+    assert offsets[0][1] == len(b"Preamble\n")
+    assert offsets[1][1] + offsets[1][2] == len(CONTENT)
+    assert CONTENT[offsets[1][1] :].startswith(b"# 1 - First\n")
+    assert list(iter_offsets(b"")) == []
+    assert list(iter_offsets(b"No headings\n")) == []
+    assert [x[1] for x in iter_offsets(b"# 1 - A\n# 2 - B\n")] == [0, 8]
+
+
+def test_build_offset_index():
+    index = build_offset_index(CONTENT)
+    assert set(index) == {1, 3}
+    offset, length = index[3]
+    assert CONTENT[offset : offset + length].endswith(b"Some # content\n\n")
+
+
+def test_find_block():
+    assert find_block(CONTENT, 1) == build_offset_index(CONTENT)[1]
+    assert find_block(CONTENT, 100) is None
+
+
+def test_parse_block():
+    offset, length = build_offset_index(CONTENT)[3]
+    issue = parse_block(CONTENT[offset : offset + length])
+    assert issue is not None
+    assert issue.id == 3
+    assert issue.status == StatusEnum.CLOSED
+    assert issue.content == "Some # content\n"
+    assert parse_block(b"") is None
+
+
+def test_read_issue(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    assert read_issue(filepath, 1) is None
+    assert read_offset_index(filepath) == {}
+    filepath.write_bytes(b"")
+    assert read_issue(filepath, 1) is None
+    assert read_offset_index(filepath) == {}
+    filepath.write_bytes(CONTENT)
+    issue = read_issue(filepath, 1)
+    assert issue is not None
+    assert issue.title == "First"
+    assert issue.environment == "BE"
+    assert read_issue(filepath, 2) is None
+    assert read_offset_index(filepath) == build_offset_index(CONTENT)
+
+
+def test_read_issue_line_separators(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    content = "see\u2028 x-y note\x0b\x0c\x1c\x1d\x1e\x85\u2029 end\n"
+    issue = Issue(id=1, title="First", content=content)
+    dump_path(filepath, [issue])
+    assert parse_path(filepath, cache=False)[0].content == content
+    found = read_issue(filepath, 1)
+    assert found is not None
+    assert found.content == content
+
+
+def test_read_issues(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    assert read_issues(filepath, {1}) == []
+    filepath.write_bytes(CONTENT)
+    assert [issue.id for issue in read_issues(filepath, {1, 3, 4})] == [3, 1]
+    assert read_issues(filepath, set()) == []
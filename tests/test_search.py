@@ -0,0 +1,62 @@
+from dataclasses import replace
+from pathlib import Path
+
+from issuetruck.issue import Issue
+from issuetruck.markdown import dump_path
+from issuetruck.search import (
+    SearchIndex,
+    load_search_index,
+    read_search_index,
+    search_path,
+    trigrams,
+)
+
+ISSUES: list[Issue] = [
+    Issue(id=3, title="Login crash", content="01/02/2023 - edit - Stack trace\n"),
+    Issue(id=2, title="Export to CSV"),
+    Issue(id=1, title="Crash on export", content="01/02/2023 - edit - CSV only\n"),
+]
+
+
+def test_trigrams():
+    assert trigrams("") == set()
+    assert trigrams("ab") == set()
+    assert trigrams("abcd") == {"abc", "bcd"}
+
+
+def test_search_index():
+    index = SearchIndex()
+    index.update(ISSUES)
+    assert len(index) == 3
+    assert index.search("CRASH") == {1, 3}
+    assert index.search("crash", content=False) == {1, 3}
+    assert index.search("csv") == {1, 2}
+    assert index.search("csv", content=False) == {2}
+    assert index.search("csv", title=False) == {1}
+    assert index.search("ex") == {1, 2}
+    assert index.search("") == {1, 2, 3}
+    assert index.search("missing") == set()
+
+
+def test_search_index_update():
+    index = SearchIndex()
+    index.update(ISSUES)
+    index.update([replace(ISSUES[0], title="Logout"), ISSUES[1]])
+    assert len(index) == 2
+    assert index.search("crash") == set()
+    assert index.search("logout") == {3}
+    assert "ash" not in index.postings
+
+
+def test_load_search_index(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    assert len(load_search_index(filepath)) == 0
+    assert not search_path(filepath).exists()
+
+    dump_path(filepath, ISSUES)
+    assert load_search_index(filepath).search("crash") == {1, 3}
+    stored, _ = read_search_index(filepath)
+    assert stored.search("crash") == {1, 3}
+
+    dump_path(filepath, ISSUES[1:])
+    assert load_search_index(filepath).search("crash") == {1}
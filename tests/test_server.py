@@ -0,0 +1,203 @@
+import socket
+import threading
+import time
+from datetime import date
+from itertools import product
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from issuetruck import daemon, lock
+from issuetruck.app import app
+from issuetruck.daemon import forward, is_running, socket_path
+from issuetruck.issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+from issuetruck.lock import lock_path
+from issuetruck.markdown import dump_path, parse_path
+from issuetruck.server import IssueStore, serve
+
+ISSUES: list[Issue] = [
+    Issue(id=2, title="Second", open_date=date(2023, 1, 2)),
+    Issue(id=1, title="First", open_date=date(2023, 1, 1), status=StatusEnum.CLOSED),
+]
+
+
+def test_issue_store(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, ISSUES)
+    store = IssueStore(filepath)
+    assert store.handle("list", {"skip": None, "limit": None, "is_open": True}) == (
+        "Filter result 1/2\n\n" + str(ISSUES[0]) + "\n"
+    )
+    assert store.handle(
+        "list", {"skip": None, "limit": 1, "sort": "open_date", "reverse": False}
+    ) == ("Filter result 1/2\n\n" + str(ISSUES[1]) + "\n")
+    output = store.handle(
+        "create",
+        {
+            "title": "Third",
+            "priority": None,
+            "issue_type": "Improvement",
+            "subtitle": "",
+            "environment": "",
+            "milestone": "",
+            "comment": "",
+            "start": 1,
+        },
+    )
+    assert output == "Created new issue\n3 - Third\n"
+    assert store.handle("status", {"issue_id": 2, "close": True}) == (
+        "Status set for issue with id = 2\n"
+    )
+    assert store.handle(
+        "edit",
+        {"issue_id": 1, "status": None, "priority": "High", "issue_type": None},
+    ) == ("Modified issue with id = 1\n")
+    assert store.handle("edit", {"issue_id": 9}) == "No issue found with id = 9\n"
+
+    issues = parse_path(filepath)
+    assert [issue.id for issue in issues] == [3, 2, 1]
+    assert issues[0].priority == PriorityEnum.LOW
+    assert issues[0].type == TypeEnum.IMPROVEMENT
+    assert issues[1].status == StatusEnum.CLOSED
+    assert issues[2].priority == PriorityEnum.HIGH
+    assert store._search is None
+    assert store.handle("search", {"query": "third"}) == (
+        "Search result 1/1\n\n" + str(issues[0]) + "\n"
+    )
+    store.handle(
+        "edit",
+        {
+            "issue_id": 2,
+            "title": "Thirdly",
+            "status": None,
+            "priority": None,
+            "issue_type": None,
+        },
+    )
+    assert store.search_index.search("third") == {2, 3}
+
+
+def test_issue_store_refresh(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, ISSUES)
+    store = IssueStore(filepath)
+    dump_path(filepath, ISSUES[:1])
+    output = store.handle("list", {"skip": None, "limit": None})
+    assert output.startswith("Filter result 1/1\n")
+
+
+def test_list_matches_local(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ISSUETRUCK_NO_DAEMON", "1")
+    issues = [
+        Issue(id=issue_id, title=f"Issue {issue_id}", status=status)
+        for issue_id, status in zip(
+            range(6, 0, -1), [StatusEnum.OPEN, StatusEnum.CLOSED] * 3
+        )
+    ]
+    dump_path(tmp_path / "ToDo.md", issues)
+    store = IssueStore(tmp_path / "ToDo.md")
+    runner = CliRunner()
+    for skip, limit, is_open, sort in product(
+        (None, 1, 3, 9), (None, 0, 2, 3), (False, True), (None, "id")
+    ):
+        args = ["list"]
+        if skip is not None:
+            args += ["--skip", str(skip)]
+        if limit is not None:
+            args += ["--limit", str(limit)]
+        if is_open:
+            args.append("--open")
+        if sort is not None:
+            args += ["--sort", sort]
+        local = runner.invoke(app, args).output
+        assert local == store.handle(
+            "list", {"skip": skip, "limit": limit, "is_open": is_open, "sort": sort}
+        ), args
+    output = store.handle("list", {"skip": None, "limit": 3, "is_open": True})
+    assert output.startswith("Filter result 3/6\n")
+    output = store.handle("list", {"skip": None, "limit": 2, "is_open": True})
+    assert output.startswith("Filter result 2+\n")
+
+
+def test_issue_store_lock(tmp_path: Path, monkeypatch):
+    filepath = tmp_path / "ToDo.md"
+    dump_path(filepath, ISSUES)
+    store = IssueStore(filepath)
+    held = []
+    refresh = store.refresh
+
+    def locked_refresh() -> None:
+        held.append(str(lock_path(filepath)) in lock._held)
+        refresh()
+
+    monkeypatch.setattr(store, "refresh", locked_refresh)
+    store.handle("status", {"issue_id": 2, "close": True})
+    assert held == [True]
+    assert not lock._held
+
+
+def test_forward(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    assert forward(filepath, "list", {}) is None
+    dump_path(filepath, ISSUES)
+    server = serve(filepath)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        assert is_running(filepath)
+        output = forward(filepath, "list", {"skip": None, "limit": 1})
+        assert output is not None
+        assert output.startswith("Filter result 1+\n")
+        assert forward(filepath, "delete", {}) == (
+            "Daemon error: ValueError: Unknown command 'delete'\n"
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+    assert not is_running(filepath)
+    assert forward(filepath, "list", {}) is None
+    socket_path(filepath).unlink()
+
+
+def test_forward_broken_daemon(tmp_path: Path, monkeypatch):
+    filepath = tmp_path / "ToDo.md"
+    monkeypatch.setattr(daemon, "TIMEOUT", 0.1)
+    for command, reply in (
+        ("list", None),
+        ("search", b'{"output": "Filter'),
+        ("create", None),
+        ("status", b'{"output": "Status'),
+    ):
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(socket_path(filepath)))
+        listener.listen()
+
+        def answer() -> None:
+            connection, _ = listener.accept()
+            with connection:
+                connection.recv(1024)
+                if reply is None:
+                    time.sleep(0.5)
+                else:
+                    connection.sendall(reply)
+
+        thread = threading.Thread(target=answer)
+        thread.start()
+        try:
+            if command in daemon.READ_COMMANDS:
+                assert forward(filepath, command, {}) is None
+            else:
+                with pytest.raises(daemon.DaemonError):
+                    forward(filepath, command, {})
+        finally:
+            thread.join()
+            listener.close()
+            socket_path(filepath).unlink()
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path(filepath)))
+    stale.close()
+    assert forward(filepath, "create", {}) is None
+    socket_path(filepath).unlink()
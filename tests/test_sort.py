@@ -0,0 +1,83 @@
+from datetime import date
+
+from issuetruck.issue import Issue, PriorityEnum
+from issuetruck.sort import SortEnum, TopK, milestone_key, sort_issues, sort_key
+
+ISSUES: list[Issue] = [
+    Issue(
+        id=1,
+        title="First",
+        priority=PriorityEnum.LOW,
+        open_date=date(2023, 3, 1),
+        milestone="0.10.0",
+    ),
+    Issue(
+        id=2,
+        title="Second",
+        priority=PriorityEnum.CRITICAL,
+        open_date=None,
+        close_date=date(2023, 4, 2),
+        milestone="0.9.1",
+    ),
+    Issue(
+        id=3,
+        title="Third",
+        priority=PriorityEnum.MEDIUM,
+        open_date=date(2023, 1, 5),
+        milestone="",
+    ),
+    Issue(
+        id=4,
+        title="Fourth",
+        priority=PriorityEnum.CRITICAL,
+        open_date=date(2023, 2, 7),
+        close_date=date(2023, 2, 9),
+        milestone="1.0.0",
+    ),
+]
+
+
+def ids(issues: list[Issue]) -> list[int]:
+    return [issue.id for issue in issues]
+
+
+def test_milestone_key():
+    assert milestone_key("0.9.1") < milestone_key("0.10.0") < milestone_key("1.0.0")
+    assert milestone_key("2.0.0-beta") == (0, 2, 0, 0)
+    assert milestone_key("") > milestone_key("99.0.0")
+
+
+def test_sort_key():
+    for sort, expected, reverse in (
+        (SortEnum.ID, [1, 2, 3, 4], [4, 3, 2, 1]),
+        (SortEnum.PRIORITY, [1, 3, 2, 4], [2, 4, 3, 1]),
+        (SortEnum.OPEN_DATE, [3, 4, 1, 2], [1, 4, 3, 2]),
+        (SortEnum.CLOSE_DATE, [4, 2, 1, 3], [2, 4, 1, 3]),
+        (SortEnum.MILESTONE, [2, 1, 4, 3], [4, 1, 2, 3]),
+    ):
+        assert ids(sorted(ISSUES, key=sort_key(sort))) == expected
+        assert ids(sorted(ISSUES, key=sort_key(sort, True))) == reverse
+
+
+def test_top_k():
+    top: TopK[str] = TopK(3)
+    for key, item in ((3, "a"), (1, "b"), (2, "c"), (1, "d"), (0, "e"), (2, "f")):
+        top.push((key,), item)
+    assert top.result() == ["e", "b", "d"]
+    assert top.count == 6
+    empty: TopK[str] = TopK(0)
+    empty.push((0,), "a")
+    assert empty.result() == []
+
+
+def test_sort_issues():
+    issues = ISSUES * 5
+    for sort in SortEnum:
+        for reverse in (False, True):
+            expected = sorted(issues, key=sort_key(sort, reverse))
+            for skip, limit in ((None, None), (None, 3), (2, 5), (18, 4), (None, 0)):
+                page, matched = sort_issues(iter(issues), sort, reverse, skip, limit)
+                start = skip or 0
+                end = None if limit is None else start + limit
+                assert page == expected[start:end]
+                assert matched == len(issues)
@@ -0,0 +1,83 @@
+import json
+from datetime import date
+from pathlib import Path
+
+from issuetruck.issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+from issuetruck.markdown import dump_path
+from issuetruck.stats import (
+    Durations,
+    compute_stats,
+    dump_stats,
+    format_stats,
+    stats_path,
+)
+
+ISSUES: list[Issue] = [
+    Issue(
+        id=3,
+        title="Third",
+        open_date=date(2023, 1, 1),
+        status=StatusEnum.CLOSED,
+        type=TypeEnum.FEATURE,
+        priority=PriorityEnum.HIGH,
+        milestone="0.10.0",
+        done_date=date(2023, 1, 11),
+        close_date=date(2023, 1, 12),
+    ),
+    Issue(
+        id=2,
+        title="Second",
+        open_date=date(2023, 1, 1),
+        status=StatusEnum.TEST,
+        milestone="0.9.0",
+        done_date=date(2023, 1, 3),
+    ),
+    Issue(id=1, title="First", open_date=date(2023, 1, 1)),
+]
+
+
+def test_durations():
+    durations = Durations()
+    assert durations.percentile(50) is None
+    assert durations.summary()["mean"] is None
+    start = date(2023, 1, 1)
+    for days in (*range(1, 101), 100):
+        durations.add(start, date.fromordinal(start.toordinal() + days))
+    durations.add(start, None)
+    assert durations.count == 101
+    assert len(durations.histogram) == 100
+    assert durations.percentile(0) == 1
+    assert durations.percentile(50) == 51
+    assert durations.percentile(99) == 100
+    assert durations.percentile(100) == 100
+    summary = durations.summary()
+    assert summary["min"] == 1
+    assert summary["max"] == 100
+    assert summary["mean"] == 50.99
+
+
+def test_compute_stats():
+    stats = compute_stats(iter(ISSUES))
+    data = stats.as_dict()
+    assert data["total"] == 3
+    assert data["status"] == {"Open": 1, "Test": 1, "Closed": 1, "Canceled": 0}
+    assert data["type"]["Bug"] == 2
+    assert data["type"]["Feature"] == 1
+    assert data["priority"]["Medium"] == 2
+    assert list(data["milestone"].items()) == [("0.9.0", 1), ("0.10.0", 1), ("", 1)]
+    assert data["open_to_done"]["count"] == 2
+    assert data["open_to_done"]["p50"] == 2
+    assert data["open_to_done"]["p90"] == 10
+    assert data["done_to_close"]["count"] == 1
+    assert data["done_to_close"]["max"] == 1
+    assert json.loads(dump_stats(stats)) == data
+    text = format_stats(stats)
+    assert text.startswith("Issues 3\n")
+    assert "(none)" in text
+
+
+def test_stats_path(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    assert stats_path(filepath).total == 0
+    dump_path(filepath, ISSUES)
+    assert stats_path(filepath).as_dict() == compute_stats(ISSUES).as_dict()
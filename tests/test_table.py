@@ -0,0 +1,56 @@
+from dataclasses import replace
+from datetime import date
+
+import pytest
+
+from issuetruck.issue import Issue, PriorityEnum, StatusEnum, TypeEnum
+from issuetruck.table import IssueTable
+
+ISSUES: list[Issue] = [
+    Issue(
+        id=2,
+        title="Second",
+        subtitle="Subtitle",
+        status=StatusEnum.CLOSED,
+        type=TypeEnum.FEATURE,
+        priority=PriorityEnum.HIGH,
+        open_date=date(2023, 2, 9),
+        done_date=date(2023, 2, 10),
+        close_date=date(2023, 2, 11),
+        environment="FE",
+        milestone="1.2.3",
+        content="Comment\n",
+    ),
+    Issue(id=1, title="First"),
+]
+
+
+def test_issue_slots():
+    with pytest.raises(AttributeError):
+        ISSUES[1].unknown = True  # type: ignore
+
+
+def test_issue_table():
+    table = IssueTable(ISSUES)
+    assert len(table) == 2
+    assert list(table) == ISSUES
+    assert table[0] == ISSUES[0]
+    assert table[-1] == ISSUES[1]
+    assert table[0:1] == ISSUES[:1]
+    assert table.ids.tolist() == [2, 1]
+    assert table.statuses.tolist() == [2, 0]
+    assert table.open_dates[0] == date(2023, 2, 9).toordinal()
+    assert table.close_dates[1] == 0
+    with pytest.raises(IndexError):
+        table[2]
+
+
+def test_issue_table_setitem():
+    table = IssueTable(ISSUES)
+    changed = replace(ISSUES[1], status=StatusEnum.TEST, done_date=date(2023, 3, 1))
+    table[1] = changed
+    assert table[1] == changed
+    assert table[0] == ISSUES[0]
+    table.append(ISSUES[1])
+    assert len(table) == 3
+    assert table[2] == ISSUES[1]
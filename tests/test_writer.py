@@ -0,0 +1,99 @@
+import os
+import stat
+from dataclasses import replace
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from issuetruck.issue import Issue, StatusEnum
+from issuetruck.markdown import dump_path, parse_path
+from issuetruck.writer import (
+    copy_range,
+    encode_issue_block,
+    splice_buffer,
+    splice_path,
+    write_path,
+)
+
+ISSUES: list[Issue] = [
+    Issue(id=3, title="Third", content="Comment\n"),
+    Issue(id=2, title="Second", subtitle="Subtitle"),
+    Issue(id=1, title="First"),
+]
+
+
+def test_render_issue():
+    assert encode_issue_block(ISSUES[0]) == str(ISSUES[0]).encode("utf8")
+
+
+def test_copy_range():
+    output = BytesIO()
+    copy_range(b"0123456789", output, 2, 7)
+    assert output.getvalue() == b"23456"
+
+
+def test_splice_buffer():
+    buffer = b"".join(encode_issue_block(issue) for issue in ISSUES)
+    changed = replace(ISSUES[1], status=StatusEnum.CLOSED, title="Changed")
+    new = Issue(id=4, title="Fourth")
+    output = BytesIO()
+    splice_buffer(buffer, output, [changed], [new])
+    expected = [new, ISSUES[0], changed, ISSUES[2]]
+    assert output.getvalue() == b"".join(encode_issue_block(x) for x in expected)
+
+    output = BytesIO()
+    splice_buffer(b"Preamble", output, new_issues=[new])
+    assert output.getvalue() == b"Preamble\n" + encode_issue_block(new)
+
+    output = BytesIO()
+    splice_buffer(buffer, output, [Issue(id=100, title="Missing")])
+    assert output.getvalue() == buffer
+
+
+def test_splice_path(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    splice_path(filepath, new_issues=[ISSUES[2]])
+    assert parse_path(filepath) == [ISSUES[2]]
+
+    dump_path(filepath, ISSUES)
+    changed = replace(ISSUES[2], content="Edited\n")
+    splice_path(filepath, [changed])
+    assert parse_path(filepath) == [ISSUES[0], ISSUES[1], changed]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_splice_path_mode(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    umask = os.umask(0o022)
+    try:
+        splice_path(filepath, new_issues=ISSUES[2:])
+        assert stat.S_IMODE(os.stat(filepath).st_mode) == 0o644
+        os.chmod(filepath, 0o600)
+        splice_path(filepath, new_issues=ISSUES[1:2])
+        assert stat.S_IMODE(os.stat(filepath).st_mode) == 0o600
+    finally:
+        os.umask(umask)
+
+
+def test_write_path(tmp_path: Path):
+    filepath = tmp_path / "ToDo.md"
+    expected = tmp_path / "Expected.md"
+    dump_path(expected, ISSUES)
+    write_path(filepath, ISSUES)
+    assert filepath.read_bytes() == expected.read_bytes()
+    os.chmod(filepath, 0o600)
+    inode = os.stat(filepath).st_ino
+
+    def failing():
+        yield ISSUES[0]
+        raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError):
+        write_path(filepath, failing())
+    assert filepath.read_bytes() == expected.read_bytes()
+    write_path(filepath, ISSUES[1:])
+    assert os.stat(filepath).st_ino != inode
+    assert stat.S_IMODE(os.stat(filepath).st_mode) == 0o600
+    assert parse_path(filepath, cache=False) == ISSUES[1:]
+    assert not list(tmp_path.glob("*.tmp"))